@@ -232,16 +232,17 @@ class RallyTUI(App[None]):
 
         # Set initial filter state for connected mode
         status_bar = self.query_one(StatusBar)
-        if self._connected and self._client.current_iteration:
-            self._iteration_filter = self._client.current_iteration
-            self._user_filter_active = True
-            status_bar.set_iteration_filter(self._iteration_filter)
-            status_bar.set_user_filter(True)
-            _log.debug(f"Initial filters: iteration={self._iteration_filter}, user=True")
-
-        # Set initial sort mode display
         ticket_list = self.query_one(TicketList)
-        status_bar.set_sort_mode(ticket_list.sort_mode)
+        with status_bar.batch_update():
+            if self._connected and self._client.current_iteration:
+                self._iteration_filter = self._client.current_iteration
+                self._user_filter_active = True
+                status_bar.set_iteration_filter(self._iteration_filter)
+                status_bar.set_user_filter(True)
+                _log.debug(f"Initial filters: iteration={self._iteration_filter}, user=True")
+
+            # Set initial sort mode display
+            status_bar.set_sort_mode(ticket_list.sort_mode)
 
         # Set up cache status callback if caching is enabled
         if self._caching_client:
@@ -529,13 +530,14 @@ class RallyTUI(App[None]):
 
         # Update status bar
         status_bar = self.query_one(StatusBar)
-        if self._iteration_filter == FILTER_BACKLOG:
-            status_bar.set_iteration_filter("Backlog")
-        elif self._iteration_filter:
-            status_bar.set_iteration_filter(self._iteration_filter)
-        else:
-            status_bar.set_iteration_filter(None)
-        status_bar.set_user_filter(self._user_filter_active)
+        with status_bar.batch_update():
+            if self._iteration_filter == FILTER_BACKLOG:
+                status_bar.set_iteration_filter("Backlog")
+            elif self._iteration_filter:
+                status_bar.set_iteration_filter(self._iteration_filter)
+            else:
+                status_bar.set_iteration_filter(None)
+            status_bar.set_user_filter(self._user_filter_active)
 
         # Update detail panel
         if tickets:
@@ -1655,17 +1657,17 @@ class RallyTUI(App[None]):
 
         # Update status bar
         status_bar = self.query_one(StatusBar)
+        with status_bar.batch_update():
+            # Set iteration filter display
+            if self._iteration_filter == FILTER_BACKLOG:
+                status_bar.set_iteration_filter("Backlog")
+            elif self._iteration_filter:
+                status_bar.set_iteration_filter(self._iteration_filter)
+            else:
+                status_bar.set_iteration_filter(None)
 
-        # Set iteration filter display
-        if self._iteration_filter == FILTER_BACKLOG:
-            status_bar.set_iteration_filter("Backlog")
-        elif self._iteration_filter:
-            status_bar.set_iteration_filter(self._iteration_filter)
-        else:
-            status_bar.set_iteration_filter(None)
-
-        # Set user filter display
-        status_bar.set_user_filter(self._user_filter_active)
+            # Set user filter display
+            status_bar.set_user_filter(self._user_filter_active)
 
         # Update detail panel
         if filtered:
@@ -1,10 +1,15 @@
 """Ticket data model - decoupled from Rally API responses."""
 
+import re
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
 TicketType = Literal["UserStory", "Defect", "Task", "TestCase"]
 
+_NON_DIGITS_RE = re.compile(r"\D+")
+
 
 @dataclass(frozen=True)
 class Ticket:
@@ -39,6 +44,11 @@ class Ticket:
     release: str = ""  # Release name
     tags: tuple[str, ...] = ()  # Tag names (tuple for frozen compatibility)
 
+    def __post_init__(self) -> None:
+        # States come from a handful of values; interning shares one string
+        # per state across tickets and lets state-table lookups match by identity
+        object.__setattr__(self, "state", sys.intern(self.state))
+
     @property
     def display_text(self) -> str:
         """Format for list display: 'US1234 User login feature'."""
@@ -52,6 +62,40 @@ class Ticket:
                 return self.formatted_id[:i]
         return self.formatted_id[:2]
 
+    # cached_property stores into the instance __dict__ directly, so it works
+    # on the frozen dataclass; values derived from fields never go stale.
+    @cached_property
+    def id_number(self) -> int:
+        """Numeric part of formatted_id, e.g. 1234 for 'US1234' (0 if none)."""
+        digits = _NON_DIGITS_RE.sub("", self.formatted_id)
+        return int(digits) if digits else 0
+
+    @cached_property
+    def owner_sort_key(self) -> tuple[int, str]:
+        """Sort key grouping unassigned tickets first, then by owner name."""
+        if self.owner is None:
+            return (0, "")
+        return (1, self.owner.lower())
+
+    @cached_property
+    def parent_sort_key(self) -> tuple[int, str]:
+        """Sort key grouping orphan tickets first, then by parent ID."""
+        if self.parent_id is None:
+            return (0, "")
+        return (1, self.parent_id.lower())
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased ID, name, owner and state, for case-insensitive search."""
+        return " ".join(
+            [
+                self.formatted_id.lower(),
+                self.name.lower(),
+                (self.owner or "").lower(),
+                (self.state or "").lower(),
+            ]
+        )
+
     def rally_url(self, server: str = "rally1.rallydev.com") -> str | None:
         """Generate Rally web URL for this ticket.
 
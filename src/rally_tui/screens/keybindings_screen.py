@@ -10,10 +10,10 @@ from textual.widgets import Button, Footer, Header, Label, Select, Static
 
 from rally_tui.user_settings import UserSettings
 from rally_tui.utils.keybindings import (
+    ACTION_CATEGORIES,
     ACTION_REGISTRY,
     find_conflicts,
     format_key_for_display,
-    get_action_categories,
 )
 
 # Profile options for selector
@@ -243,11 +243,10 @@ class KeybindingsScreen(Screen[bool]):
 
         # Keybindings list
         with VerticalScroll(id="keybindings-content"):
-            categories = get_action_categories()
             conflicts = find_conflicts(self._temp_bindings)
             conflict_keys = {c.key for c in conflicts}
 
-            for category, action_ids in categories.items():
+            for category, action_ids in ACTION_CATEGORIES.items():
                 yield Label(category, classes="category-header")
                 for action_id in action_ids:
                     if action_id in ACTION_REGISTRY:
@@ -287,7 +286,7 @@ class KeybindingsScreen(Screen[bool]):
                 # Load profile defaults
                 from rally_tui.utils.keybindings import get_profile_keybindings
 
-                self._temp_bindings = get_profile_keybindings(profile)
+                self._temp_bindings = dict(get_profile_keybindings(profile))
                 self._refresh_all_rows()
                 self._changed = True
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from collections import ChainMap
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -31,7 +33,7 @@ class UserSettings:
     DEFAULT_LOG_LEVEL = "INFO"
     VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
     # Default parent Feature IDs for quick selection
-    DEFAULT_PARENT_OPTIONS: list[str] = ["F59625", "F59627", "F59628"]
+    DEFAULT_PARENT_OPTIONS: tuple[str, ...] = ("F59625", "F59627", "F59628")
     # Default keybinding profile
     DEFAULT_KEYBINDING_PROFILE = "vim"
     # Cache settings defaults
@@ -47,14 +49,23 @@ class UserSettings:
         self._load()
 
     def _load(self) -> None:
-        """Load settings from config file."""
-        if self.CONFIG_FILE.exists():
-            try:
-                with self.CONFIG_FILE.open("r") as f:
-                    self._settings = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                # If file is corrupted, start fresh
-                self._settings = {}
+        """Load settings from config file.
+
+        The file is read in a single call and parsed from bytes, so a
+        missing file costs one failed open rather than a stat plus open.
+        """
+        try:
+            data = self.CONFIG_FILE.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError:
+            self._settings = {}
+            return
+        try:
+            self._settings = json.loads(data)
+        except ValueError:
+            # If file is corrupted, start fresh
+            self._settings = {}
 
     def _save(self) -> None:
         """Save settings to config file."""
@@ -105,19 +116,24 @@ class UserSettings:
         self._save()
 
     @property
-    def parent_options(self) -> list[str]:
-        """Get the list of quick-select parent Feature IDs.
+    def parent_options(self) -> tuple[str, ...]:
+        """Get the quick-select parent Feature IDs.
 
-        Returns a copy to prevent mutation of internal state.
+        Returns an immutable tuple, so no copy is needed to protect
+        internal state. Values loaded from file are converted once.
         """
-        return list(self._settings.get("parent_options", self.DEFAULT_PARENT_OPTIONS))
+        options = self._settings.get("parent_options", self.DEFAULT_PARENT_OPTIONS)
+        if not isinstance(options, tuple):
+            options = tuple(options)
+            self._settings["parent_options"] = options
+        return options
 
     @parent_options.setter
-    def parent_options(self, value: list[str]) -> None:
+    def parent_options(self, value: list[str] | tuple[str, ...]) -> None:
         """Set and persist the parent options list."""
-        if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        if not isinstance(value, list | tuple) or not all(isinstance(v, str) for v in value):
             raise ValueError("Parent options must be a list of strings")
-        self._settings["parent_options"] = value
+        self._settings["parent_options"] = tuple(value)
         self._save()
 
     def get(self, key: str, default: Any = None) -> Any:
@@ -148,24 +164,25 @@ class UserSettings:
         self._save()
 
     @property
-    def keybindings(self) -> dict[str, str]:
+    def keybindings(self) -> Mapping[str, str]:
         """Get the current keybindings.
 
-        Returns merged keybindings: profile defaults + user overrides.
-        Returns a copy to prevent mutation of internal state.
+        Returns merged keybindings: user overrides layered over the profile
+        defaults. The defaults are not copied; writes to the returned map
+        land in a fresh override layer, so internal state is never mutated.
         """
-        # Start with profile defaults
-        profile = self.keybinding_profile
-        result = get_profile_keybindings(profile)
+        defaults = get_profile_keybindings(self.keybinding_profile)
 
-        # Apply any user overrides
+        # Only keep well-formed overrides for known actions
+        overrides: dict[str, str] = {}
         custom = self._settings.get("keybindings", {})
         if isinstance(custom, dict):
             for action_id, key in custom.items():
-                if isinstance(key, str) and action_id in result:
-                    result[action_id] = key
+                if isinstance(key, str) and action_id in defaults:
+                    overrides[action_id] = key
 
-        return result
+        # ChainMap only writes to its first map, so the read-only defaults are safe
+        return ChainMap(overrides, defaults)  # type: ignore[arg-type]
 
     @keybindings.setter
     def keybindings(self, value: dict[str, str]) -> None:
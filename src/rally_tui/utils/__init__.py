@@ -2,6 +2,7 @@
 
 from rally_tui.utils.html_to_text import extract_images_from_html, html_to_text
 from rally_tui.utils.keybindings import (
+    ACTION_CATEGORIES,
     ACTION_REGISTRY,
     EMACS_KEYBINDINGS,
     VALID_PROFILES,
@@ -26,6 +27,7 @@ __all__ = [
     "setup_logging",
     "RedactingFilter",
     # Keybinding exports
+    "ACTION_CATEGORIES",
     "ACTION_REGISTRY",
     "EMACS_KEYBINDINGS",
     "VALID_PROFILES",
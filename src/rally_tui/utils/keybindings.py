@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import NamedTuple
 
 
@@ -158,18 +161,26 @@ EMACS_KEYBINDINGS: dict[str, str] = {
 VALID_PROFILES = ("vim", "emacs", "custom")
 
 
-def get_profile_keybindings(profile: str) -> dict[str, str]:
+# Read-only views of the profile defaults, shared by all callers
+_PROFILE_VIEWS: dict[str, Mapping[str, str]] = {
+    "vim": MappingProxyType(VIM_KEYBINDINGS),
+    "emacs": MappingProxyType(EMACS_KEYBINDINGS),
+}
+
+
+def get_profile_keybindings(profile: str) -> Mapping[str, str]:
     """Get keybindings for a profile.
 
+    Returns a read-only view; callers that need to edit the bindings
+    should copy it with dict().
+
     Args:
         profile: Profile name ('vim', 'emacs', or 'custom')
 
     Returns:
-        Dictionary of action_id -> key mappings
+        Mapping of action_id -> key mappings
     """
-    if profile == "emacs":
-        return dict(EMACS_KEYBINDINGS)
-    return dict(VIM_KEYBINDINGS)
+    return _PROFILE_VIEWS.get(profile, _PROFILE_VIEWS["vim"])
 
 
 @dataclass
@@ -181,27 +192,32 @@ class KeyConflict:
     action2: str
 
 
-def find_conflicts(keybindings: dict[str, str]) -> list[KeyConflict]:
+def find_conflicts(keybindings: Mapping[str, str]) -> list[KeyConflict]:
     """Find duplicate key assignments in keybindings.
 
     Args:
-        keybindings: Dictionary of action_id -> key mappings
+        keybindings: Mapping of action_id -> key mappings
 
     Returns:
         List of KeyConflict for any duplicate keys
     """
+    # Most keymaps have no duplicates; detect that without building the index
+    if len(set(keybindings.values())) == len(keybindings):
+        return []
+
     key_to_action: dict[str, str] = {}
     conflicts: list[KeyConflict] = []
 
     for action_id, key in keybindings.items():
-        if key in key_to_action:
-            conflicts.append(KeyConflict(key, key_to_action[key], action_id))
-        else:
-            key_to_action[key] = action_id
+        # Single probe: returns the first action bound to this key
+        first = key_to_action.setdefault(key, action_id)
+        if first is not action_id:
+            conflicts.append(KeyConflict(key, first, action_id))
 
     return conflicts
 
 
+@lru_cache(maxsize=256)
 def normalize_key(key: str) -> str:
     """Normalize a key string to consistent format.
 
@@ -211,9 +227,25 @@ def normalize_key(key: str) -> str:
     Returns:
         Normalized key string like "ctrl+s"
     """
-    return key.lower().strip()
+    key = key.strip()
+    # Stored keys are already lowercase; islower() avoids a copy for them
+    return key if key.islower() else key.lower()
+
+
+# Display text for modifier and named key parts. Shift maps to an empty
+# string: shift+letter is shown as just the uppercase letter.
+_KEY_PART_DISPLAY: dict[str, str] = {
+    "ctrl": "Ctrl",
+    "alt": "Alt",
+    "meta": "Meta",
+    "shift": "",
+    "space": "Space",
+    "tab": "Tab",
+    "slash": "/",
+}
 
 
+@lru_cache(maxsize=256)
 def format_key_for_display(key: str) -> str:
     """Format a key string for display.
 
@@ -223,56 +255,31 @@ def format_key_for_display(key: str) -> str:
     Returns:
         Display string like "Ctrl+S", "G" (Shift+letter shows uppercase)
     """
-    parts = key.split("+")
+    key_lower = key if key.islower() else key.lower()
+    shift_in_combo = "shift" in key_lower
     formatted = []
 
-    for part in parts:
-        part = part.strip().lower()
-        if part == "ctrl":
-            formatted.append("Ctrl")
-        elif part == "alt":
-            formatted.append("Alt")
-        elif part == "meta":
-            formatted.append("Meta")
-        elif part == "shift":
-            # For shift+letter, we'll show just the uppercase letter
-            continue
-        elif part == "space":
-            formatted.append("Space")
-        elif part == "tab":
-            formatted.append("Tab")
-        elif part == "slash":
-            formatted.append("/")
-        elif len(part) == 1:
-            # Single letter - uppercase if shift was in the combo
-            if "shift" in key.lower():
-                formatted.append(part.upper())
-            else:
-                formatted.append(part)
+    for part in key_lower.split("+"):
+        part = part.strip()
+        if part in _KEY_PART_DISPLAY:
+            display = _KEY_PART_DISPLAY[part]
+            if display:
+                formatted.append(display)
+        elif len(part) == 1 and not shift_in_combo:
+            formatted.append(part)
         else:
-            # Function keys, etc.
+            # Shifted letters, function keys, etc.
             formatted.append(part.upper())
 
     return "+".join(formatted) if len(formatted) > 1 else formatted[0] if formatted else key
 
 
-def validate_key(key: str) -> bool:
-    """Validate a key string.
-
-    Args:
-        key: Key string to validate
+# Modifier names accepted in key combinations
+_VALID_MODIFIERS: frozenset[str] = frozenset({"ctrl", "alt", "meta", "shift"})
 
-    Returns:
-        True if key is valid, False otherwise
-    """
-    if not key or not isinstance(key, str):
-        return False
-
-    normalized = normalize_key(key)
-    parts = normalized.split("+")
-
-    valid_modifiers = {"ctrl", "alt", "meta", "shift"}
-    valid_special_keys = {
+# Named (non-character) keys accepted in key combinations
+_VALID_SPECIAL_KEYS: frozenset[str] = frozenset(
+    {
         "space",
         "tab",
         "enter",
@@ -310,41 +317,62 @@ def validate_key(key: str) -> bool:
         "minus",
         "equal",
     }
+)
+
+
+# Every key used by a built-in profile; these are known valid and skip parsing
+_PROFILE_KEYS: frozenset[str] = frozenset(VIM_KEYBINDINGS.values()) | frozenset(
+    EMACS_KEYBINDINGS.values()
+)
+
+
+def validate_key(key: str) -> bool:
+    """Validate a key string.
+
+    Args:
+        key: Key string to validate
+
+    Returns:
+        True if key is valid, False otherwise
+    """
+    if not key or not isinstance(key, str):
+        return False
+
+    if key in _PROFILE_KEYS:
+        return True
 
-    modifiers = []
     key_part = None
 
-    for part in parts:
-        if part in valid_modifiers:
-            modifiers.append(part)
-        elif key_part is None:
-            key_part = part
-        else:
+    for part in normalize_key(key).split("+"):
+        if part in _VALID_MODIFIERS:
+            continue
+        if key_part is not None:
             # Multiple non-modifier keys
             return False
+        key_part = part
 
-    if key_part is None:
-        # Only modifiers, no actual key
-        return False
+    # Need an actual key (not only modifiers): a single char or valid special key
+    return key_part is not None and (len(key_part) == 1 or key_part in _VALID_SPECIAL_KEYS)
 
-    # Key must be single char or valid special key
-    if len(key_part) == 1 or key_part in valid_special_keys:
-        return True
 
-    return False
+def _group_actions_by_category() -> dict[str, tuple[str, ...]]:
+    """Group ACTION_REGISTRY ids by category, preserving registry order."""
+    categories: dict[str, list[str]] = {}
+    for action_id, action in ACTION_REGISTRY.items():
+        categories.setdefault(action.category, []).append(action_id)
+    return {category: tuple(action_ids) for category, action_ids in categories.items()}
+
+
+# Read-only category -> action_ids view, computed once since the registry is static
+ACTION_CATEGORIES: Mapping[str, tuple[str, ...]] = MappingProxyType(_group_actions_by_category())
 
 
 def get_action_categories() -> dict[str, list[str]]:
     """Get actions grouped by category.
 
+    Returns a mutable copy; read-only callers can use ACTION_CATEGORIES.
+
     Returns:
         Dictionary of category -> list of action_ids
     """
-    categories: dict[str, list[str]] = {}
-
-    for action_id, action in ACTION_REGISTRY.items():
-        if action.category not in categories:
-            categories[action.category] = []
-        categories[action.category].append(action_id)
-
-    return categories
+    return {category: list(action_ids) for category, action_ids in ACTION_CATEGORIES.items()}
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import sys
-from logging.handlers import RotatingFileHandler
 from typing import TYPE_CHECKING
 
 from rally_tui.utils.redacting_filter import RedactingFilter
 
 if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
     from rally_tui.user_settings import UserSettings
 
 # Module-level logger
@@ -18,6 +20,21 @@ logger = logging.getLogger("rally_tui")
 # Flag to track if logging has been initialized
 _initialized = False
 
+# Background listener that owns the real handlers (file and stderr)
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background listener, if running."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging(settings: UserSettings | None = None) -> logging.Logger:
     """Configure logging for rally-tui.
@@ -25,18 +42,26 @@ def setup_logging(settings: UserSettings | None = None) -> logging.Logger:
     Sets up both file and stderr handlers. File logs go to
     ~/.config/rally-tui/rally-tui.log with rotation.
 
+    The logger itself only has a QueueHandler; a QueueListener thread
+    runs redaction, formatting and disk I/O so logging calls made from
+    the UI thread do not block on the file.
+
     Args:
         settings: User settings to get log level. If None, uses INFO.
 
     Returns:
         The configured logger instance.
     """
-    global _initialized
+    global _initialized, _listener
 
     if _initialized:
         return logger
 
-    # Import here to avoid circular imports
+    # Deferred so importing rally_tui.utils (e.g. from the CLI) stays cheap;
+    # UserSettings is also imported here to avoid circular imports
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+    from queue import SimpleQueue
+
     from rally_tui.user_settings import UserSettings
 
     if settings is None:
@@ -52,8 +77,9 @@ def setup_logging(settings: UserSettings | None = None) -> logging.Logger:
     # Prevent propagation to root logger
     logger.propagate = False
 
-    # Clear any existing handlers
+    # Clear any existing handlers and stop a previous listener
     logger.handlers.clear()
+    _stop_listener()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -73,20 +99,24 @@ def setup_logging(settings: UserSettings | None = None) -> logging.Logger:
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Stderr handler for ERROR and above (visible if app crashes)
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setLevel(logging.ERROR)
     stderr_handler.setFormatter(formatter)
-    logger.addHandler(stderr_handler)
 
     # Add redacting filter to all handlers (enabled by default)
     redact_enabled = settings.redact_logs
     redacting_filter = RedactingFilter(enabled=redact_enabled)
-    for handler in logger.handlers:
+    for handler in (file_handler, stderr_handler):
         handler.addFilter(redacting_filter)
 
+    # Hand records to the listener thread; it applies per-handler levels
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, stderr_handler, respect_handler_level=True)
+    _listener.start()
+
     _initialized = True
     redact_status = "enabled" if redact_enabled else "disabled"
     logger.info(f"Logging initialized at level {level_name} (redaction: {redact_status})")
@@ -114,11 +144,14 @@ def set_log_level(level: str) -> None:
     Args:
         level: New log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
     """
+    from logging.handlers import RotatingFileHandler
+
     level_value = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(level_value)
 
-    # Update file handler level (first handler)
-    for handler in logger.handlers:
+    # Update file handler level (owned by the queue listener)
+    handlers = _listener.handlers if _listener is not None else tuple(logger.handlers)
+    for handler in handlers:
         if isinstance(handler, RotatingFileHandler):
             handler.setLevel(level_value)
             break
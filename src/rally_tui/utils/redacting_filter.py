@@ -28,7 +28,7 @@ class RedactingFilter(logging.Filter):
 
     # Patterns are ordered from most specific to least specific
     # Each tuple: (name, replacement_text, compiled_regex)
-    PATTERNS: ClassVar[list[tuple[str, str, re.Pattern[str]]]] = [
+    PATTERNS: ClassVar[tuple[tuple[str, str, re.Pattern[str]], ...]] = (
         # API credentials (most important to redact)
         (
             "api_key",
@@ -99,19 +99,64 @@ class RedactingFilter(logging.Filter):
             "token=[REDACTED]",
             re.compile(r"token[=:]\s*[\"']?[\w\-_.]+", re.IGNORECASE),
         ),
-        # URL credentials (user:pass@host)
+        # URL credentials (user:pass@host). The userinfo cannot contain
+        # whitespace, so a match never spans into unrelated text.
         (
             "url_creds",
             "://[REDACTED]@",
-            re.compile(r"://[^:]+:[^@]+@"),
+            re.compile(r"://[^:/\s@]+:[^@\s]+@"),
         ),
-        # PII - email addresses
+        # PII - email addresses. The lookbehind only lets a match start at
+        # the beginning of a run of local-part characters, and the local part
+        # is matched possessively, so a long run without an "@" is rejected
+        # in linear time and a long address is redacted whole.
         (
             "email",
             "[EMAIL]",
-            re.compile(r"[\w\.-]+@[\w\.-]+\.\w{2,}"),
+            re.compile(r"(?<![\w.-])[\w.-]++@[\w.-]+\.\w{2,}"),
         ),
-    ]
+    )
+
+    # All patterns unioned into one alternation so a message is scanned once.
+    # Each alternative is a named group; the match's lastgroup selects the
+    # replacement. Earlier alternatives win at the same position, preserving
+    # the specific-to-general ordering of PATTERNS.
+    #
+    # Limitation: unlike applying PATTERNS one by one, text consumed by a
+    # match is not rescanned. When fragments run together without a space,
+    # the leftmost match wins and can swallow the start of the next one:
+    # 'token=Owner.DisplayName != "Bob"' redacts the token value but keeps
+    # "Bob". Space-separated messages, as logged by this app, redact the same.
+    _COMBINED: ClassVar[re.Pattern[str]] = re.compile(
+        "|".join(f"(?P<{name}>{pattern.pattern})" for name, _repl, pattern in PATTERNS),
+        re.IGNORECASE,
+    )
+    _REPLACEMENTS: ClassVar[dict[str, str]] = {
+        name: replacement for name, replacement, _pattern in PATTERNS
+    }
+
+    # Lowercase substrings at least one of which appears in any match of
+    # PATTERNS. Messages containing none of them skip the regex entirely.
+    # IGNORECASE lets the dotless "\u0131" and dotted "\u0130" match "i",
+    # but casefold() leaves the former unchanged and turns the latter into
+    # "i" plus a combining dot "\u0307", so both are listed as triggers.
+    _TRIGGERS: ClassVar[tuple[str, ...]] = (
+        "apikey",
+        "zsessionid",
+        "bearer",
+        "displayname",
+        "current user:",
+        "workspace:",
+        "project.name",
+        "iteration.name",
+        "password",
+        "secret",
+        "token",
+        "://",
+        "@",
+        "\u0131",
+        "\u0307",
+    )
 
     def __init__(self, enabled: bool = True) -> None:
         """Initialize the redacting filter.
@@ -125,6 +170,10 @@ class RedactingFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter and redact sensitive data from log record.
 
+        The filter is attached to handlers, so it only runs for records
+        that pass the handler's level. When several handlers share a
+        record, the message and arguments are redacted only once.
+
         Args:
             record: The log record to process.
 
@@ -132,23 +181,36 @@ class RedactingFilter(logging.Filter):
             True always - the record is allowed through after redaction.
         """
         if self.enabled:
-            # Redact main message
-            record.msg = self._redact(str(record.msg))
-
-            # Redact string arguments
-            if record.args:
-                record.args = tuple(
-                    self._redact(str(arg)) if isinstance(arg, str) else arg for arg in record.args
-                )
-
-            # Redact exception info if present
+            if not getattr(record, "_rally_redacted", False):
+                # Redact main message
+                record.msg = self._redact(str(record.msg))
+
+                # Redact string arguments; the tuple is only rebuilt when
+                # at least one argument is a string
+                args = record.args
+                if isinstance(args, tuple):
+                    if any(isinstance(arg, str) for arg in args):
+                        redact = self._redact
+                        record.args = tuple(
+                            redact(arg) if isinstance(arg, str) else arg for arg in args
+                        )
+                elif args:
+                    # Single mapping argument used with %(name)s formatting
+                    record.args = {
+                        key: self._redact(value) if isinstance(value, str) else value
+                        for key, value in args.items()
+                    }
+
+                record._rally_redacted = True
+
+            # Redact exception info if present (set by the first formatter)
             if record.exc_text:
                 record.exc_text = self._redact(record.exc_text)
 
         return True  # Always allow the record through
 
     def _redact(self, message: str) -> str:
-        """Apply all redaction patterns to a message.
+        """Apply all redaction patterns to a message in a single pass.
 
         Args:
             message: The message to redact.
@@ -156,6 +218,11 @@ class RedactingFilter(logging.Filter):
         Returns:
             The message with sensitive data replaced by redaction placeholders.
         """
-        for _name, replacement, pattern in self.PATTERNS:
-            message = pattern.sub(replacement, message)
-        return message
+        folded = message.casefold()
+        if not any(trigger in folded for trigger in self._TRIGGERS):
+            return message
+        replacements = self._REPLACEMENTS
+        return self._COMBINED.sub(
+            lambda m: replacements[m.lastgroup],  # type: ignore[index]
+            message,
+        )
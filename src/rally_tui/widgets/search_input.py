@@ -2,15 +2,19 @@
 
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Input
 
 
 class SearchInput(Input):
     """Input field for search/filter queries.
 
-    Emits SearchChanged on each keystroke and SearchCleared on Escape.
+    Emits SearchChanged once typing pauses and SearchCleared on Escape.
     """
 
+    # Seconds of typing inactivity before SearchChanged is posted
+    DEBOUNCE_DELAY = 0.06
+
     BINDINGS = [
         Binding("escape", "clear_search", "Clear", show=False, priority=True),
     ]
@@ -68,16 +72,35 @@ class SearchInput(Input):
             id=id,
             classes=classes,
         )
+        self._pending_search: Timer | None = None
+        self._last_query: str | None = None
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Emit SearchChanged when input changes."""
-        self.post_message(self.SearchChanged(event.value))
+        """Schedule SearchChanged, restarting the delay on each keystroke."""
+        if self._pending_search is not None:
+            self._pending_search.stop()
+        self._pending_search = self.set_timer(self.DEBOUNCE_DELAY, self._emit_search_changed)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
-        """Emit SearchSubmitted when Enter pressed."""
+        """Flush any pending search and emit SearchSubmitted when Enter pressed."""
+        self._flush_search()
         self.post_message(self.SearchSubmitted(event.value))
 
     def action_clear_search(self) -> None:
         """Clear search and emit SearchCleared."""
         self.value = ""
         self.post_message(self.SearchCleared())
+
+    def _flush_search(self) -> None:
+        """Emit a pending SearchChanged immediately."""
+        if self._pending_search is not None:
+            self._pending_search.stop()
+            self._emit_search_changed()
+
+    def _emit_search_changed(self) -> None:
+        """Post SearchChanged unless the query matches the last one posted."""
+        self._pending_search = None
+        query = self.value
+        if query != self._last_query:
+            self._last_query = query
+            self.post_message(self.SearchChanged(query))
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
+from functools import cache
 from typing import TYPE_CHECKING
 
+from textual.timer import Timer
 from textual.widgets import Static
 
 if TYPE_CHECKING:
@@ -20,6 +24,29 @@ class CacheStatusDisplay(Enum):
     OFFLINE = "offline"
 
 
+# Rendered cache status for states that carry no age
+_CACHE_DISPLAY: dict[CacheStatusDisplay | None, str] = {
+    CacheStatusDisplay.LIVE: "[green]● Live[/]",
+    CacheStatusDisplay.REFRESHING: "[cyan]◌ Refreshing...[/]",
+    CacheStatusDisplay.OFFLINE: "[red]⚠ Offline[/]",
+}
+
+
+@cache
+def _sort_mode_displays() -> dict[SortMode, tuple[str, str]]:
+    """Map each sort mode to its name and rendered segment, built on first use."""
+    # Import here to avoid circular import
+    from rally_tui.widgets.ticket_list import SortMode
+
+    names = {
+        SortMode.CREATED: "Recent",
+        SortMode.STATE: "State",
+        SortMode.OWNER: "Owner",
+        SortMode.PARENT: "Parent",
+    }
+    return {mode: (name, f"Sort: {name}") for mode, name in names.items()}
+
+
 class StatusBar(Static):
     """Displays workspace/project info and connection status.
 
@@ -27,6 +54,9 @@ class StatusBar(Static):
     at the top of the application (below the header).
     """
 
+    # Setters within this window are coalesced into a single render
+    UPDATE_DELAY = 0.016
+
     DEFAULT_CSS = """
     StatusBar {
         dock: top;
@@ -60,68 +90,103 @@ class StatusBar(Static):
         super().__init__(id=id, classes=classes)
         self._workspace = workspace
         self._project = project
+        self._project_display = f"Project: {project}" if project else ""
         self._connected = connected
         self._current_user = current_user
+        self._status_display = self._format_status()
         self._display_content = ""
         self._filter_info = ""
         self._iteration_filter: str | None = None
         self._user_filter_active = False
+        self._filters_display = ""  # Rendered sprint / My Items segment
         self._sort_mode: str | None = None  # Display name of current sort mode
+        self._sort_display = ""  # Rendered "Sort: <name>" segment
         self._selection_count = 0  # Number of selected tickets
+        self._selection_display = ""
         self._cache_status: CacheStatusDisplay | None = None
         self._cache_age_minutes: int | None = None
+        self._cache_display = ""  # Rendered cache status, set with the status
         self._loading = False
+        self._suspend_updates = 0  # Nesting depth of batch_update()
+        self._dirty = False  # A setter ran while updates were suspended
+        self._pending_update: Timer | None = None
 
     def on_mount(self) -> None:
         """Set initial content when mounted."""
         self._update_display()
 
-    def _update_display(self) -> None:
-        """Update the status bar content."""
-        parts = []
-        if self._project:
-            parts.append(f"Project: {self._project}")
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Defer re-rendering until several fields have been set.
 
-        # Show loading indicator if fetching tickets
-        if self._loading:
-            parts.append("[bold cyan]Loading...[/]")
+        Setters called inside the block only record their values; the bar
+        is rebuilt once on exit.
+        """
+        self._suspend_updates += 1
+        try:
+            yield
+        finally:
+            self._suspend_updates -= 1
+            if not self._suspend_updates and self._dirty:
+                self._flush_update()
+
+    def _schedule_update(self) -> None:
+        """Render after UPDATE_DELAY, coalescing setters called meanwhile.
+
+        Inside batch_update() the render is left to the end of the block.
+        Before mounting there is no timer to run, so the bar renders at once.
+        """
+        if self._suspend_updates:
+            self._dirty = True
+        elif not self.is_mounted:
+            self._update_display()
+        elif self._pending_update is None:
+            self._pending_update = self.set_timer(self.UPDATE_DELAY, self._flush_update)
+
+    def _flush_update(self) -> None:
+        """Run a pending render now."""
+        if self._pending_update is not None:
+            self._pending_update.stop()
+            self._pending_update = None
+        self._update_display()
 
-        # Show selection count if any tickets selected
-        if self._selection_count > 0:
-            parts.append(f"[bold cyan]{self._selection_count} selected[/]")
+    def _update_display(self) -> None:
+        """Update the status bar content."""
+        if self._suspend_updates:
+            self._dirty = True
+            return
+        self._dirty = False
+
+        # One slot per segment, in display order; setters keep each
+        # pre-rendered and an empty slot is omitted
+        slots = (
+            self._project_display,
+            "[bold cyan]Loading...[/]" if self._loading else "",
+            self._selection_display,
+            self._filters_display,
+            self._sort_display,
+            self._filter_info,
+            self._cache_display,
+            self._status_display,
+        )
+        content = " | ".join(slot for slot in slots if slot)
+        # Setters often re-apply the current value; skip the repaint then
+        if content == self._display_content:
+            return
+        self._display_content = content
+        self.update(content)
+
+    def _format_status(self) -> str:
+        """Format the connection status segment.
 
-        # Build filter display
-        filters = []
-        if self._iteration_filter:
-            filters.append(f"Sprint: {self._iteration_filter}")
-        if self._user_filter_active:
-            filters.append("[cyan]My Items[/]")
-        if filters:
-            parts.append(" ".join(filters))
-
-        # Show sort mode
-        if self._sort_mode:
-            parts.append(f"Sort: {self._sort_mode}")
-
-        if self._filter_info:
-            parts.append(self._filter_info)
-
-        # Show cache status if set
-        if self._cache_status:
-            cache_display = self._format_cache_status()
-            if cache_display:
-                parts.append(cache_display)
-
-        if self._connected:
-            if self._current_user:
-                status = f"Connected as {self._current_user}"
-            else:
-                status = "Connected"
-        else:
-            status = "Offline"
-        parts.append(status)
-        self._display_content = " | ".join(parts)
-        self.update(self._display_content)
+        Returns:
+            "Connected as <user>", "Connected" or "Offline".
+        """
+        if not self._connected:
+            return "Offline"
+        if self._current_user:
+            return f"Connected as {self._current_user}"
+        return "Connected"
 
     def _format_cache_status(self) -> str:
         """Format cache status for display.
@@ -129,23 +194,16 @@ class StatusBar(Static):
         Returns:
             Formatted cache status string with symbol and optional age.
         """
-        if not self._cache_status:
-            return ""
-
-        if self._cache_status == CacheStatusDisplay.LIVE:
-            return "[green]● Live[/]"
-        elif self._cache_status == CacheStatusDisplay.CACHED:
+        if self._cache_status == CacheStatusDisplay.CACHED:
             age_str = f" ({self._cache_age_minutes}m)" if self._cache_age_minutes else ""
             return f"[yellow]○ Cached{age_str}[/]"
-        elif self._cache_status == CacheStatusDisplay.REFRESHING:
-            return "[cyan]◌ Refreshing...[/]"
-        elif self._cache_status == CacheStatusDisplay.OFFLINE:
-            return "[red]⚠ Offline[/]"
-        return ""
+        return _CACHE_DISPLAY.get(self._cache_status, "")
 
     @property
     def display_content(self) -> str:
         """Get the current display content string."""
+        if self._pending_update is not None:
+            self._flush_update()
         return self._display_content
 
     def set_workspace(self, workspace: str) -> None:
@@ -155,7 +213,7 @@ class StatusBar(Static):
             workspace: New workspace name.
         """
         self._workspace = workspace
-        self._update_display()
+        self._schedule_update()
 
     def set_project(self, project: str) -> None:
         """Update the project name.
@@ -164,7 +222,8 @@ class StatusBar(Static):
             project: New project name.
         """
         self._project = project
-        self._update_display()
+        self._project_display = f"Project: {project}" if project else ""
+        self._schedule_update()
 
     @property
     def workspace(self) -> str:
@@ -188,7 +247,8 @@ class StatusBar(Static):
             connected: Whether connected to Rally API.
         """
         self._connected = connected
-        self._update_display()
+        self._status_display = self._format_status()
+        self._schedule_update()
 
     def set_filter_info(self, filtered: int, total: int, query: str = "") -> None:
         """Show filter count and search query in status bar.
@@ -202,12 +262,12 @@ class StatusBar(Static):
             self._filter_info = f"Search: [cyan]{query}[/] ({filtered}/{total})"
         else:
             self._filter_info = f"Filtered: {filtered}/{total}"
-        self._update_display()
+        self._schedule_update()
 
     def clear_filter_info(self) -> None:
         """Clear filter info from status bar."""
         self._filter_info = ""
-        self._update_display()
+        self._schedule_update()
 
     @property
     def filter_info(self) -> str:
@@ -221,7 +281,7 @@ class StatusBar(Static):
             iteration_name: Name of the iteration to show, or None to clear.
         """
         self._iteration_filter = iteration_name
-        self._update_display()
+        self._update_filters_display()
 
     @property
     def iteration_filter(self) -> str | None:
@@ -235,7 +295,17 @@ class StatusBar(Static):
             active: Whether the user filter is active.
         """
         self._user_filter_active = active
-        self._update_display()
+        self._update_filters_display()
+
+    def _update_filters_display(self) -> None:
+        """Rebuild the sprint / My Items segment and refresh the bar."""
+        filters = []
+        if self._iteration_filter:
+            filters.append(f"Sprint: {self._iteration_filter}")
+        if self._user_filter_active:
+            filters.append("[cyan]My Items[/]")
+        self._filters_display = " ".join(filters)
+        self._schedule_update()
 
     @property
     def user_filter_active(self) -> bool:
@@ -248,17 +318,8 @@ class StatusBar(Static):
         Args:
             mode: The sort mode to display.
         """
-        # Import here to avoid circular import
-        from rally_tui.widgets.ticket_list import SortMode
-
-        mode_names = {
-            SortMode.CREATED: "Recent",
-            SortMode.STATE: "State",
-            SortMode.OWNER: "Owner",
-            SortMode.PARENT: "Parent",
-        }
-        self._sort_mode = mode_names.get(mode)
-        self._update_display()
+        self._sort_mode, self._sort_display = _sort_mode_displays().get(mode, (None, ""))
+        self._schedule_update()
 
     @property
     def sort_mode_display(self) -> str | None:
@@ -272,7 +333,8 @@ class StatusBar(Static):
             count: Number of selected tickets.
         """
         self._selection_count = count
-        self._update_display()
+        self._selection_display = f"[bold cyan]{count} selected[/]" if count > 0 else ""
+        self._schedule_update()
 
     @property
     def selection_count(self) -> int:
@@ -286,9 +348,13 @@ class StatusBar(Static):
             status: The cache status to display.
             age_minutes: Age of the cache in minutes (for CACHED status).
         """
+        if status is self._cache_status and age_minutes == self._cache_age_minutes:
+            # Status pollers often re-report the same state
+            return
         self._cache_status = status
         self._cache_age_minutes = age_minutes
-        self._update_display()
+        self._cache_display = self._format_cache_status()
+        self._schedule_update()
 
     @property
     def cache_status(self) -> CacheStatusDisplay | None:
@@ -304,7 +370,8 @@ class StatusBar(Static):
         """Clear the cache status from display."""
         self._cache_status = None
         self._cache_age_minutes = None
-        self._update_display()
+        self._cache_display = ""
+        self._schedule_update()
 
     def set_loading(self, loading: bool) -> None:
         """Set the loading indicator state.
@@ -313,7 +380,7 @@ class StatusBar(Static):
             loading: Whether tickets are currently being loaded.
         """
         self._loading = loading
-        self._update_display()
+        self._schedule_update()
 
     @property
     def is_loading(self) -> bool:
@@ -1,11 +1,13 @@
 """Ticket detail widget for displaying full ticket information."""
 
-from typing import Literal
+from functools import lru_cache
+from typing import Any, Literal
 
 from rich.markup import escape
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.reactive import reactive
+from textual.widget import Widget
 from textual.widgets import Static
 
 from rally_tui.models import Ticket
@@ -14,6 +16,22 @@ from rally_tui.utils import html_to_text
 ContentView = Literal["description", "notes"]
 
 
+@lru_cache(maxsize=256)
+def _render_body(html: str) -> str:
+    """Convert a ticket body to escaped plain text for display.
+
+    Cached because toggling the view or re-selecting a ticket renders the
+    same HTML again.
+
+    Args:
+        html: Raw HTML description or notes.
+
+    Returns:
+        Markup-escaped plain text, empty if the body has no text content.
+    """
+    return escape(html_to_text(html))
+
+
 class TicketDetail(VerticalScroll):
     """Displays detailed information about a selected ticket.
 
@@ -24,9 +42,30 @@ class TicketDetail(VerticalScroll):
 
     can_focus = True  # Allow this widget to receive focus via Tab
 
+    _DIVIDER = "─" * 40
+    _DESC_LABEL = "\nDescription:"
+    _NOTES_LABEL = "\nNotes:"
+    # Placeholders contain no markup, so they are displayed without escaping
+    _NO_DESCRIPTION = "No description available."
+    _NO_NOTES = "No notes available."
+    _EMPTY_HEADER = "No ticket selected"
+    _EMPTY_METADATA = "Select a ticket from the list to view details"
+
     ticket: reactive[Ticket | None] = reactive(None)
     content_view: reactive[ContentView] = reactive("description")
 
+    def __init__(self, *children: Widget, **kwargs: Any) -> None:
+        """Initialize the ticket detail view.
+
+        Args:
+            *children: Child widgets, as for VerticalScroll.
+            **kwargs: VerticalScroll keyword arguments (name, id, classes, ...).
+        """
+        super().__init__(*children, **kwargs)
+        # Child Statics and the last text pushed to each, keyed by selector
+        self._statics: dict[str, Static] = {}
+        self._rendered: dict[str, str] = {}
+
     def compose(self) -> ComposeResult:
         """Create the detail view structure."""
         yield Static(id="detail-header")
@@ -49,22 +88,20 @@ class TicketDetail(VerticalScroll):
 
     def _show_empty_state(self) -> None:
         """Display placeholder when no ticket selected."""
-        self.query_one("#detail-header", Static).update("No ticket selected")
-        self.query_one("#detail-divider", Static).update("")
-        self.query_one("#detail-metadata", Static).update(
-            "Select a ticket from the list to view details"
-        )
-        self.query_one("#detail-description-label", Static).update("")
-        self.query_one("#detail-description", Static).update("")
+        self._update_static("#detail-header", self._EMPTY_HEADER)
+        self._update_static("#detail-divider", "")
+        self._update_static("#detail-metadata", self._EMPTY_METADATA)
+        self._update_static("#detail-description-label", "")
+        self._update_static("#detail-description", "")
 
     def _show_ticket(self, ticket: Ticket) -> None:
         """Display the ticket details."""
         # Header: ID and Name
         header = f"{ticket.formatted_id} - {ticket.name}"
-        self.query_one("#detail-header", Static).update(header)
+        self._update_static("#detail-header", header)
 
         # Divider
-        self.query_one("#detail-divider", Static).update("─" * 40)
+        self._update_static("#detail-divider", self._DIVIDER)
 
         # Metadata section: Owner, Iteration, Points, State
         owner_display = ticket.owner or "Unassigned"
@@ -76,7 +113,7 @@ class TicketDetail(VerticalScroll):
             f"Points: {points_display}\n"
             f"State: {ticket.state}"
         )
-        self.query_one("#detail-metadata", Static).update(metadata)
+        self._update_static("#detail-metadata", metadata)
 
         # Content section (description or notes)
         self._update_content_section(ticket)
@@ -84,16 +121,34 @@ class TicketDetail(VerticalScroll):
     def _update_content_section(self, ticket: Ticket) -> None:
         """Update the content section based on current view."""
         if self.content_view == "description":
-            label = "\nDescription:"
-            content = ticket.description or "No description available."
-            content = html_to_text(content) or "No description available."
+            label = self._DESC_LABEL
+            raw = ticket.description
+            placeholder = self._NO_DESCRIPTION
         else:
-            label = "\nNotes:"
-            content = ticket.notes or "No notes available."
-            content = html_to_text(content) or "No notes available."
-
-        self.query_one("#detail-description-label", Static).update(label)
-        self.query_one("#detail-description", Static).update(escape(content))
+            label = self._NOTES_LABEL
+            raw = ticket.notes
+            placeholder = self._NO_NOTES
+
+        # Only real bodies go through the HTML conversion
+        content = _render_body(raw) if raw else ""
+        self._update_static("#detail-description-label", label)
+        self._update_static("#detail-description", content or placeholder)
+
+    def _update_static(self, selector: str, content: str) -> None:
+        """Update a child Static, skipping the repaint if its text is unchanged.
+
+        Args:
+            selector: ID selector of the child Static.
+            content: Text to display.
+        """
+        if self._rendered.get(selector) == content:
+            return
+        self._rendered[selector] = content
+        static = self._statics.get(selector)
+        if static is None:
+            # Children never change after compose, so each is looked up once
+            static = self._statics[selector] = self.query_one(selector, Static)
+        static.update(content)
 
     def toggle_content_view(self) -> None:
         """Toggle between description and notes view."""
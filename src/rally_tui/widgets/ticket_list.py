@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import bisect
+import sys
+from collections.abc import Callable, Iterable
+from contextlib import nullcontext
 from enum import Enum
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -114,30 +120,85 @@ DEFAULT_STATE_COLOR = "white"
 DEFAULT_STATE_SYMBOL = "?"
 
 
+# Order, color and symbol per state, so a single lookup serves all three.
+# Keys are interned like Ticket.state, so lookups usually match by identity.
+STATE_META: dict[str, tuple[int, str, str]] = {
+    sys.intern(state): (order, STATE_COLORS[state], STATE_SYMBOLS[state])
+    for state, order in STATE_ORDER.items()
+}
+_DEFAULT_STATE_META = (DEFAULT_STATE_ORDER, DEFAULT_STATE_COLOR, DEFAULT_STATE_SYMBOL)
+
+
+def get_state_meta(state: str | None) -> tuple[int, str, str]:
+    """Get (order, color, symbol) for a state, with defaults for unknown states."""
+    return STATE_META.get(state or "", _DEFAULT_STATE_META)
+
+
 def get_state_order(state: str | None) -> int:
     """Get sort order for a state. Lower = earlier in workflow."""
-    if not state:
-        return DEFAULT_STATE_ORDER
-    return STATE_ORDER.get(state, DEFAULT_STATE_ORDER)
+    return STATE_META.get(state or "", _DEFAULT_STATE_META)[0]
 
 
 def get_state_color(state: str | None) -> str:
     """Get color for a state indicator."""
-    if not state:
-        return DEFAULT_STATE_COLOR
-    return STATE_COLORS.get(state, DEFAULT_STATE_COLOR)
+    return STATE_META.get(state or "", _DEFAULT_STATE_META)[1]
 
 
 def get_state_symbol(state: str | None) -> str:
     """Get symbol for a state indicator."""
-    if not state:
-        return DEFAULT_STATE_SYMBOL
-    return STATE_SYMBOLS.get(state, DEFAULT_STATE_SYMBOL)
+    return STATE_META.get(state or "", _DEFAULT_STATE_META)[2]
+
+
+def _state_order_key(ticket: Ticket) -> int:
+    """Sort key for state order; a direct table lookup, as states are never None."""
+    return STATE_ORDER.get(ticket.state, DEFAULT_STATE_ORDER)
+
+
+def _newest_first_key(ticket: Ticket) -> int:
+    """Sort key for newest first; higher IDs are newer, so negate the number."""
+    # Ticket.id_number is cached per ticket, so re-sorting doesn't re-parse IDs
+    return -ticket.id_number
+
+
+# The one ordering per mode, used by sorting and by bisect in add_ticket.
+# Owner and parent keys are cached on Ticket and read with C-level attrgetters.
+_SORT_KEYS: dict[SortMode, Callable[[Ticket], Any]] = {
+    SortMode.CREATED: _newest_first_key,
+    SortMode.STATE: _state_order_key,
+    SortMode.OWNER: attrgetter("owner_sort_key"),
+    SortMode.PARENT: attrgetter("parent_sort_key"),
+}
+
+
+def get_sort_key(mode: SortMode) -> Callable[[Ticket], Any]:
+    """Get the key function that orders tickets for a sort mode.
+
+    Args:
+        mode: The sort mode.
+
+    Returns:
+        Key function usable with sorted() and bisect.
+    """
+    # Default to most recent
+    return _SORT_KEYS.get(mode, _newest_first_key)
+
+
+def sort_tickets(tickets: list[Ticket], mode: SortMode) -> list[Ticket]:
+    """Sort tickets by the specified mode.
+
+    Args:
+        tickets: List of tickets to sort.
+        mode: The sort mode to use.
+
+    Returns:
+        Sorted list of tickets.
+    """
+    return sorted(tickets, key=get_sort_key(mode))
 
 
 def sort_tickets_by_state(tickets: list[Ticket]) -> list[Ticket]:
     """Sort tickets by state order (earliest first)."""
-    return sorted(tickets, key=lambda t: get_state_order(t.state))
+    return sort_tickets(tickets, SortMode.STATE)
 
 
 def sort_tickets_by_created(tickets: list[Ticket]) -> list[Ticket]:
@@ -146,60 +207,45 @@ def sort_tickets_by_created(tickets: list[Ticket]) -> list[Ticket]:
     Uses FormattedID as a proxy for creation order since higher IDs
     are assigned to newer tickets.
     """
-
-    def get_id_number(ticket: Ticket) -> int:
-        """Extract numeric part of FormattedID for sorting."""
-        # Extract digits from FormattedID (e.g., "US1234" -> 1234)
-        digits = "".join(c for c in ticket.formatted_id if c.isdigit())
-        return int(digits) if digits else 0
-
-    return sorted(tickets, key=get_id_number, reverse=True)
+    return sort_tickets(tickets, SortMode.CREATED)
 
 
 def sort_tickets_by_owner(tickets: list[Ticket]) -> list[Ticket]:
     """Sort tickets by owner name (unassigned first, then alphabetical)."""
-
-    def get_owner_key(ticket: Ticket) -> tuple[int, str]:
-        """Return sort key: (0, "") for None, (1, name) for assigned."""
-        if ticket.owner is None:
-            return (0, "")
-        return (1, ticket.owner.lower())
-
-    return sorted(tickets, key=get_owner_key)
+    return sort_tickets(tickets, SortMode.OWNER)
 
 
 def sort_tickets_by_parent(tickets: list[Ticket]) -> list[Ticket]:
     """Sort tickets by parent ID (orphans first, then alphabetical by parent)."""
+    return sort_tickets(tickets, SortMode.PARENT)
 
-    def get_parent_key(ticket: Ticket) -> tuple[int, str]:
-        """Return sort key: (0, "") for None (orphans), (1, parent_id) for assigned."""
-        if ticket.parent_id is None:
-            return (0, "")
-        return (1, ticket.parent_id.lower())
 
-    return sorted(tickets, key=get_parent_key)
+# Selection checkbox text, shared by every item
+CHECKBOX_ON = "[✓]"
+CHECKBOX_OFF = "[ ]"
 
 
-def sort_tickets(tickets: list[Ticket], mode: SortMode) -> list[Ticket]:
-    """Sort tickets by the specified mode.
+@lru_cache(maxsize=32)
+def _type_class(type_prefix: str) -> str:
+    """CSS class for a ticket type prefix, e.g. 'ticket-us' for 'US'."""
+    return f"ticket-{type_prefix.lower()}"
 
-    Args:
-        tickets: List of tickets to sort.
-        mode: The sort mode to use.
 
-    Returns:
-        Sorted list of tickets.
-    """
-    if mode == SortMode.CREATED:
-        return sort_tickets_by_created(tickets)
-    elif mode == SortMode.STATE:
-        return sort_tickets_by_state(tickets)
-    elif mode == SortMode.OWNER:
-        return sort_tickets_by_owner(tickets)
-    elif mode == SortMode.PARENT:
-        return sort_tickets_by_parent(tickets)
-    else:
-        return sort_tickets_by_created(tickets)  # Default to most recent
+@lru_cache(maxsize=64)
+def _state_markup(state: str | None) -> str:
+    """Colored state symbol markup, built once per distinct state."""
+    _, color, symbol = get_state_meta(state)
+    return f"[{color}]{symbol}[/]"
+
+
+@lru_cache(maxsize=64)
+def _format_points(points: float | None) -> str:
+    """Format story points for the wide view (decimals only when needed)."""
+    if points is None:
+        return "-"
+    if points == int(points):
+        return str(int(points))
+    return str(points)
 
 
 class TicketListItem(ListItem):
@@ -209,21 +255,19 @@ class TicketListItem(ListItem):
         super().__init__()
         self.ticket = ticket
         self._selected = selected
+        self._checkbox: Label | None = None  # Set in compose
 
     def compose(self) -> ComposeResult:
         """Create the ticket display with selection checkbox and state indicator."""
-        type_class = f"ticket-{self.ticket.type_prefix.lower()}"
-        state_color = get_state_color(self.ticket.state)
-        state_symbol = get_state_symbol(self.ticket.state)
-        checkbox = "[✓]" if self._selected else "[ ]"
+        type_class = _type_class(self.ticket.type_prefix)
+        checkbox = CHECKBOX_ON if self._selected else CHECKBOX_OFF
 
         with Horizontal(classes="ticket-row"):
+            # Checkbox text is literal, so toggling it skips markup parsing
+            self._checkbox = Label(checkbox, markup=False, classes="selection-checkbox")
+            yield self._checkbox
             yield Label(
-                checkbox,
-                classes="selection-checkbox",
-            )
-            yield Label(
-                f"[{state_color}]{state_symbol}[/]",
+                _state_markup(self.ticket.state),
                 classes="state-indicator",
             )
             yield Label(
@@ -231,17 +275,21 @@ class TicketListItem(ListItem):
                 classes=f"ticket-text {type_class}",
             )
 
+    def set_ticket(self, ticket: Ticket) -> None:
+        """Show an updated version of the ticket, redrawing the row if it changed."""
+        changed = ticket != self.ticket
+        self.ticket = ticket
+        if changed and self.is_mounted:
+            self.refresh(recompose=True)
+
     def set_selected(self, selected: bool) -> None:
         """Update selection state and refresh checkbox display."""
         if self._selected == selected:
             return
         self._selected = selected
-        checkbox = "[✓]" if selected else "[ ]"
-        try:
-            label = self.query_one(".selection-checkbox", Label)
-            label.update(checkbox)
-        except Exception:
-            pass  # Widget may not be mounted yet
+        # Before compose there is no label; compose will read _selected
+        if self._checkbox is not None:
+            self._checkbox.update(CHECKBOX_ON if selected else CHECKBOX_OFF)
 
     @property
     def is_selected(self) -> bool:
@@ -256,22 +304,15 @@ class WideTicketListItem(ListItem):
         super().__init__()
         self.ticket = ticket
         self._selected = selected
+        self._checkbox: Label | None = None  # Set in compose
 
     def compose(self) -> ComposeResult:
         """Create the ticket display with additional columns."""
-        type_class = f"ticket-{self.ticket.type_prefix.lower()}"
-        state_color = get_state_color(self.ticket.state)
-        state_symbol = get_state_symbol(self.ticket.state)
-        checkbox = "[✓]" if self._selected else "[ ]"
+        type_class = _type_class(self.ticket.type_prefix)
+        checkbox = CHECKBOX_ON if self._selected else CHECKBOX_OFF
 
         # Format points display (show decimal only if not a whole number)
-        if self.ticket.points is not None:
-            if self.ticket.points == int(self.ticket.points):
-                points_str = str(int(self.ticket.points))
-            else:
-                points_str = str(self.ticket.points)
-        else:
-            points_str = "-"
+        points_str = _format_points(self.ticket.points)
 
         # Format owner display (truncate long names)
         owner_str = self.ticket.owner[:18] if self.ticket.owner else "-"
@@ -280,12 +321,11 @@ class WideTicketListItem(ListItem):
         parent_str = self.ticket.parent_id if self.ticket.parent_id else "-"
 
         with Horizontal(classes="ticket-row-wide"):
+            # Checkbox text is literal, so toggling it skips markup parsing
+            self._checkbox = Label(checkbox, markup=False, classes="selection-checkbox")
+            yield self._checkbox
             yield Label(
-                checkbox,
-                classes="selection-checkbox",
-            )
-            yield Label(
-                f"[{state_color}]{state_symbol}[/]",
+                _state_markup(self.ticket.state),
                 classes="state-indicator",
             )
             yield Label(
@@ -305,17 +345,21 @@ class WideTicketListItem(ListItem):
                 classes="ticket-parent",
             )
 
+    def set_ticket(self, ticket: Ticket) -> None:
+        """Show an updated version of the ticket, redrawing the row if it changed."""
+        changed = ticket != self.ticket
+        self.ticket = ticket
+        if changed and self.is_mounted:
+            self.refresh(recompose=True)
+
     def set_selected(self, selected: bool) -> None:
         """Update selection state and refresh checkbox display."""
         if self._selected == selected:
             return
         self._selected = selected
-        checkbox = "[✓]" if selected else "[ ]"
-        try:
-            label = self.query_one(".selection-checkbox", Label)
-            label.update(checkbox)
-        except Exception:
-            pass  # Widget may not be mounted yet
+        # Before compose there is no label; compose will read _selected
+        if self._checkbox is not None:
+            self._checkbox.update(CHECKBOX_ON if selected else CHECKBOX_OFF)
 
     @property
     def is_selected(self) -> bool:
@@ -362,7 +406,7 @@ class TicketList(ListView):
     class SelectionChanged(Message):
         """Posted when multi-select selection changes."""
 
-        def __init__(self, count: int, selected_ids: set[str]) -> None:
+        def __init__(self, count: int, selected_ids: frozenset[str]) -> None:
             self.count = count
             self.selected_ids = selected_ids
             super().__init__()
@@ -403,10 +447,19 @@ class TicketList(ListView):
         self._tickets = sorted_tickets
         self._all_tickets = list(sorted_tickets)
         self._filter_query = ""
+        # Lowercased query whose matches _tickets holds exactly ("" if none)
+        self._filtered_by = ""
+        # Whether _all_tickets is in sort-mode order; in-place updates can
+        # move a ticket's sort key without re-sorting
+        self._all_sorted = True
         # Multi-select tracking
         self._selected_ids: set[str] = set()
+        # Mounted list items in display order, keyed by formatted_id
+        self._item_by_id: dict[str, TicketListItem | WideTicketListItem] = {}
 
-    def _create_list_item(self, ticket: Ticket, selected: bool = False) -> ListItem:
+    def _create_list_item(
+        self, ticket: Ticket, selected: bool = False
+    ) -> TicketListItem | WideTicketListItem:
         """Create appropriate list item based on view mode."""
         if self._view_mode == ViewMode.WIDE:
             return WideTicketListItem(ticket, selected=selected)
@@ -414,9 +467,116 @@ class TicketList(ListView):
 
     def compose(self) -> ComposeResult:
         """Create list items for each ticket."""
+        self._item_by_id = {}
         for ticket in self._tickets:
             is_selected = ticket.formatted_id in self._selected_ids
-            yield self._create_list_item(ticket, selected=is_selected)
+            item = self._create_list_item(ticket, selected=is_selected)
+            self._item_by_id[ticket.formatted_id] = item
+            yield item
+
+    def _items_match(self, tickets: list[Ticket]) -> bool:
+        """Check whether the mounted items already show these ticket IDs in order."""
+        if len(tickets) != len(self._item_by_id):
+            return False
+        item_type = WideTicketListItem if self._view_mode == ViewMode.WIDE else TicketListItem
+        for ticket, (ticket_id, item) in zip(tickets, self._item_by_id.items(), strict=True):
+            if type(item) is not item_type or ticket.formatted_id != ticket_id:
+                return False
+        return True
+
+    def _sync_items(self, tickets: list[Ticket]) -> bool:
+        """Show list items for tickets, preserving selection state.
+
+        When the mounted items already show these tickets in order, they are
+        kept and only redrawn where a ticket or checkbox changed. When the
+        tickets are an in-order subset of the shown ones, as when a search
+        is narrowed, the other items are removed. Otherwise the items are
+        rebuilt.
+
+        Args:
+            tickets: Tickets to display, in order.
+
+        Returns:
+            True if any items were added or removed.
+        """
+        if self._items_match(tickets):
+            kept = None
+        else:
+            kept = self._subset_items(tickets)
+            if kept is None:
+                self._rebuild_items(tickets)
+                return True
+            self.remove_children(
+                [item for ticket_id, item in self._item_by_id.items() if ticket_id not in kept]
+            )
+            self._item_by_id = kept
+        for ticket, item in zip(tickets, self._item_by_id.values(), strict=True):
+            item.set_ticket(ticket)
+        self._update_all_selection_display()
+        return kept is not None
+
+    def _subset_items(
+        self, tickets: list[Ticket]
+    ) -> dict[str, TicketListItem | WideTicketListItem] | None:
+        """Find mounted items for tickets that are an in-order subset of the shown ones.
+
+        Args:
+            tickets: Tickets to display, in order.
+
+        Returns:
+            The items to keep, keyed by formatted_id, or None if tickets
+            are not such a subset.
+        """
+        if not tickets or len(tickets) > len(self._item_by_id):
+            return None
+        item_type = WideTicketListItem if self._view_mode == ViewMode.WIDE else TicketListItem
+        kept: dict[str, TicketListItem | WideTicketListItem] = {}
+        items = iter(self._item_by_id.items())
+        for ticket in tickets:
+            ticket_id = ticket.formatted_id
+            # Skip shown items until this ticket's; stop if it isn't shown
+            for shown_id, item in items:
+                if shown_id == ticket_id:
+                    break
+            else:
+                return None
+            if type(item) is not item_type:
+                return None
+            kept[ticket_id] = item
+        return kept
+
+    def _rebuild_items(self, tickets: list[Ticket]) -> None:
+        """Replace all mounted items with new ones for tickets."""
+        # Use remove_children/mount for synchronous update to avoid race conditions
+        # (clear/append can have timing issues when called from worker callbacks)
+        self.remove_children()
+        selected_ids = self._selected_ids
+        self._item_by_id = {
+            ticket.formatted_id: self._create_list_item(
+                ticket, selected=ticket.formatted_id in selected_ids
+            )
+            for ticket in tickets
+        }
+        if self._item_by_id:
+            # One mount call for all items, so they are added in a single batch
+            self.mount(*self._item_by_id.values())
+
+    def _insert_item(self, pos: int, ticket: Ticket) -> None:
+        """Mount an item for ticket at pos among the current items.
+
+        Args:
+            pos: Display position for the new item.
+            ticket: Ticket to show.
+        """
+        items = list(self._item_by_id.values())
+        item = self._create_list_item(ticket, selected=ticket.formatted_id in self._selected_ids)
+        if pos < len(items):
+            self.mount(item, before=items[pos])
+        else:
+            self.mount(item)
+        items.insert(pos, item)
+        # Rebuild the map so its order keeps matching the display order
+        self._item_by_id = {item.ticket.formatted_id: item for item in items}
 
     def on_mount(self) -> None:
         """Apply dynamic keybindings on mount."""
@@ -480,7 +640,9 @@ class TicketList(ListView):
 
         # Update the checkbox display for current item
         self._update_item_selection(ticket_id)
-        self.post_message(self.SelectionChanged(len(self._selected_ids), set(self._selected_ids)))
+        self.post_message(
+            self.SelectionChanged(len(self._selected_ids), frozenset(self._selected_ids))
+        )
 
     def action_select_all(self) -> None:
         """Select all visible tickets, or deselect all if all are selected (Ctrl+A)."""
@@ -488,39 +650,48 @@ class TicketList(ListView):
             # All selected, deselect all
             self.clear_selection()
         else:
-            # Select all
-            self._selected_ids = {t.formatted_id for t in self._tickets}
-            self._update_all_selection_display()
+            # Select all; only rows that were not already selected need repainting
+            new_ids = {t.formatted_id for t in self._tickets}
+            added = new_ids - self._selected_ids
+            self._selected_ids = new_ids
+            self._update_items_selection(added)
             self.post_message(
-                self.SelectionChanged(len(self._selected_ids), set(self._selected_ids))
+                self.SelectionChanged(len(self._selected_ids), frozenset(self._selected_ids))
             )
 
     def clear_selection(self) -> None:
         """Clear all selections."""
         if not self._selected_ids:
             return
-        self._selected_ids.clear()
-        self._update_all_selection_display()
-        self.post_message(self.SelectionChanged(0, set()))
+        previous = self._selected_ids
+        self._selected_ids = set()
+        self._update_items_selection(previous)
+        self.post_message(self.SelectionChanged(0, frozenset()))
 
     def _update_item_selection(self, ticket_id: str) -> None:
         """Update checkbox display for a specific ticket."""
-        is_selected = ticket_id in self._selected_ids
-        for item in self.query(TicketListItem):
-            if item.ticket.formatted_id == ticket_id:
-                item.set_selected(is_selected)
-                break
+        item = self._item_by_id.get(ticket_id)
+        if item is not None:
+            item.set_selected(ticket_id in self._selected_ids)
+
+    def _update_items_selection(self, ticket_ids: Iterable[str]) -> None:
+        """Update checkbox display for several tickets in one screen update."""
+        # Before mounting there is no app, and nothing is drawn yet anyway
+        with self.app.batch_update() if self.is_mounted else nullcontext():
+            for ticket_id in ticket_ids:
+                self._update_item_selection(ticket_id)
 
     def _update_all_selection_display(self) -> None:
         """Update checkbox display for all items."""
-        for item in self.query(TicketListItem):
-            is_selected = item.ticket.formatted_id in self._selected_ids
-            item.set_selected(is_selected)
+        self._update_items_selection(self._item_by_id)
 
     @property
     def selected_tickets(self) -> list[Ticket]:
-        """Get list of selected tickets (multi-select)."""
-        return [t for t in self._tickets if t.formatted_id in self._selected_ids]
+        """Get list of selected tickets (multi-select), in display order."""
+        selected_ids = self._selected_ids
+        if not selected_ids:
+            return []
+        return [t for t in self._tickets if t.formatted_id in selected_ids]
 
     @property
     def selection_count(self) -> int:
@@ -557,10 +728,7 @@ class TicketList(ListView):
 
         # Rebuild the list with new item type
         current_index = self.index
-        self.remove_children()
-        for ticket in self._tickets:
-            is_selected = ticket.formatted_id in self._selected_ids
-            self.mount(self._create_list_item(ticket, selected=is_selected))
+        self._sync_items(self._tickets)
 
         # Restore index
         if current_index is not None and self._tickets:
@@ -580,20 +748,18 @@ class TicketList(ListView):
         self._tickets = sorted_tickets
         self._all_tickets = list(sorted_tickets)
         self._filter_query = ""
+        self._filtered_by = ""
+        self._all_sorted = True
         # Clear selection when tickets are replaced
         had_selection = bool(self._selected_ids)
         self._selected_ids.clear()
-        # Use remove_children/mount for synchronous update to avoid race conditions
-        # (clear/append can have timing issues when called from worker callbacks)
-        self.remove_children()
-        for ticket in sorted_tickets:
-            self.mount(self._create_list_item(ticket, selected=False))
+        self._sync_items(sorted_tickets)
         # Select first item if list is not empty
         if sorted_tickets:
             self.index = 0
         # Notify if selection was cleared
         if had_selection:
-            self.post_message(self.SelectionChanged(0, set()))
+            self.post_message(self.SelectionChanged(0, frozenset()))
 
     def set_sort_mode(self, mode: SortMode) -> None:
         """Change the sort mode and re-sort the current tickets.
@@ -605,8 +771,9 @@ class TicketList(ListView):
             return
 
         self._sort_mode = mode
-        # Re-sort the all_tickets list
-        self._all_tickets = sort_tickets(self._all_tickets, mode)
+        # Re-sort the all_tickets list in place; the widget owns it
+        self._all_tickets.sort(key=get_sort_key(mode))
+        self._all_sorted = True
 
         # Re-apply any active filter with new sort order
         if self._filter_query:
@@ -616,10 +783,8 @@ class TicketList(ListView):
             self._tickets = list(self._all_tickets)
 
         # Refresh the display (preserve selection state)
-        self.clear()
-        for ticket in self._tickets:
-            is_selected = ticket.formatted_id in self._selected_ids
-            self.append(self._create_list_item(ticket, selected=is_selected))
+        if self._sync_items(self._tickets):
+            self.index = None
 
         # Select first item if list is not empty and notify listeners
         if self._tickets:
@@ -635,33 +800,28 @@ class TicketList(ListView):
                    Empty string shows all tickets.
         """
         self._filter_query = query
+        query_lower = query.lower()
 
         if not query:
             filtered = list(self._all_tickets)
         else:
-            query_lower = query.lower()
-            filtered = [t for t in self._all_tickets if self._matches_query(t, query_lower)]
+            previous = self._filtered_by
+            if previous and query_lower != previous and query_lower.startswith(previous):
+                # Typing extends the query, so matches can only narrow
+                pool = self._tickets
+            else:
+                pool = self._all_tickets
+            filtered = [t for t in pool if self._matches_query(t, query_lower)]
 
         self._tickets = filtered
-        # Use remove_children/mount for synchronous update to avoid race conditions
-        self.remove_children()
-        for ticket in filtered:
-            is_selected = ticket.formatted_id in self._selected_ids
-            self.mount(self._create_list_item(ticket, selected=is_selected))
+        self._filtered_by = query_lower
+        self._sync_items(filtered)
 
         self.post_message(self.FilterApplied(len(filtered), len(self._all_tickets)))
 
     def _matches_query(self, ticket: Ticket, query: str) -> bool:
         """Check if ticket matches search query."""
-        searchable = " ".join(
-            [
-                ticket.formatted_id.lower(),
-                ticket.name.lower(),
-                (ticket.owner or "").lower(),
-                (ticket.state or "").lower(),
-            ]
-        )
-        return query in searchable
+        return query in ticket.search_text
 
     def clear_filter(self) -> None:
         """Clear filter and show all tickets."""
@@ -713,35 +873,41 @@ class TicketList(ListView):
         updates = {t.formatted_id: t for t in tickets}
 
         # Update all matching tickets in _all_tickets
+        key = get_sort_key(self._sort_mode)
         for i, t in enumerate(self._all_tickets):
             if t.formatted_id in updates:
-                self._all_tickets[i] = updates[t.formatted_id]
+                updated = updates[t.formatted_id]
+                if not resort and key(updated) != key(t):
+                    # Left in place, so the list is out of order until re-sorted
+                    self._all_sorted = False
+                self._all_tickets[i] = updated
 
         if resort:
-            # Re-sort all tickets by current sort mode
-            self._all_tickets = sort_tickets(self._all_tickets, self._sort_mode)
+            # Re-sort all tickets by current sort mode, in place
+            self._all_tickets.sort(key=key)
+            self._all_sorted = True
 
             # If no filter is active, rebuild displayed tickets
             if not self._filter_query:
                 self._tickets = list(self._all_tickets)
                 # Rebuild the UI list (preserve selection state)
-                # Use remove_children for synchronous removal to avoid race conditions
-                self.remove_children()
-                for t in self._tickets:
-                    is_selected = t.formatted_id in self._selected_ids
-                    self.mount(self._create_list_item(t, selected=is_selected))
+                self._sync_items(self._tickets)
             else:
                 # Re-apply filter (which will also sort)
                 self.filter_tickets(self._filter_query)
         else:
+            # Updated tickets may now match the filter without being shown,
+            # so the next filter must scan everything
+            self._filtered_by = ""
             # Update in filtered tickets without re-sorting
             for i, t in enumerate(self._tickets):
                 if t.formatted_id in updates:
-                    self._tickets[i] = updates[t.formatted_id]
+                    updated = updates[t.formatted_id]
+                    self._tickets[i] = updated
                     # Update the corresponding list item
-                    items = list(self.query(TicketListItem)) + list(self.query(WideTicketListItem))
-                    if i < len(items):
-                        items[i].ticket = updates[t.formatted_id]
+                    item = self._item_by_id.get(t.formatted_id)
+                    if item is not None:
+                        item.set_ticket(updated)
 
     def add_ticket(self, ticket: Ticket) -> None:
         """Add a new ticket to the list.
@@ -749,26 +915,36 @@ class TicketList(ListView):
         Args:
             ticket: The new ticket to add.
         """
-        # Add to all_tickets
-        self._all_tickets.append(ticket)
-
-        # Re-sort all tickets by current sort mode
-        self._all_tickets = sort_tickets(self._all_tickets, self._sort_mode)
+        key = get_sort_key(self._sort_mode)
+        was_sorted = self._all_sorted
+        if was_sorted:
+            # Insert at the ticket's position; bisect_right places it after
+            # equal keys, as a stable re-sort would
+            pos = bisect.bisect_right(self._all_tickets, key(ticket), key=key)
+            self._all_tickets.insert(pos, ticket)
+        else:
+            # Out of order after in-place updates, so re-sort everything
+            self._all_tickets.append(ticket)
+            self._all_tickets.sort(key=key)
+            self._all_sorted = True
+            pos = next(i for i, t in enumerate(self._all_tickets) if t is ticket)
 
         # If no filter is active, add to displayed tickets
         if not self._filter_query:
-            self._tickets = list(self._all_tickets)
-            # Rebuild the UI list (preserve selection state)
-            # Use remove_children/mount for synchronous update
-            self.remove_children()
-            for t in self._tickets:
-                is_selected = t.formatted_id in self._selected_ids
-                self.mount(self._create_list_item(t, selected=is_selected))
+            # After a full re-sort the other rows may have moved too
+            if was_sorted and self._items_match(self._tickets):
+                # Mount just the new item instead of rebuilding the list
+                self._insert_item(pos, ticket)
+                self._tickets = list(self._all_tickets)
+                if self.index == pos:
+                    # Same position, new item: force the highlight to move
+                    self.index = None
+            else:
+                self._tickets = list(self._all_tickets)
+                # Rebuild the UI list (preserve selection state)
+                self._sync_items(self._tickets)
             # Select the new ticket
-            for i, t in enumerate(self._tickets):
-                if t.formatted_id == ticket.formatted_id:
-                    self.index = i
-                    break
+            self.index = pos
         else:
             # Re-apply filter
             self.filter_tickets(self._filter_query)
@@ -240,7 +240,7 @@ class TestConfigScreenSaving:
             await pilot.pause()
 
             # Verify parent options were saved
-            assert settings.parent_options == ["F99999", "F88888", "F77777"]
+            assert settings.parent_options == ("F99999", "F88888", "F77777")
 
     async def test_empty_parent_options_filtered(self, tmp_path: Path, monkeypatch) -> None:
         """Empty parent option fields should be filtered out."""
@@ -266,7 +266,7 @@ class TestConfigScreenSaving:
             await pilot.pause()
 
             # Only non-empty values should be saved
-            assert settings.parent_options == ["F111"]
+            assert settings.parent_options == ("F111",)
 
     async def test_parent_options_uppercased(self, tmp_path: Path, monkeypatch) -> None:
         """Parent options should be uppercased on save."""
@@ -1,6 +1,9 @@
 """Tests for keybinding utilities."""
 
+import pytest
+
 from rally_tui.utils.keybindings import (
+    ACTION_CATEGORIES,
     ACTION_REGISTRY,
     EMACS_KEYBINDINGS,
     VALID_PROFILES,
@@ -128,12 +131,17 @@ class TestGetProfileKeybindings:
         bindings = get_profile_keybindings("invalid")
         assert bindings == VIM_KEYBINDINGS
 
-    def test_returns_copy(self) -> None:
-        """Should return a copy, not the original."""
+    def test_returns_read_only_view(self) -> None:
+        """Should return a read-only view that cannot modify the defaults."""
         bindings = get_profile_keybindings("vim")
-        bindings["action.quit"] = "changed"
+        with pytest.raises(TypeError):
+            bindings["action.quit"] = "changed"  # type: ignore[index]
         assert VIM_KEYBINDINGS["action.quit"] == "q"
 
+    def test_returns_shared_view(self) -> None:
+        """Repeated calls should not allocate a new mapping."""
+        assert get_profile_keybindings("emacs") is get_profile_keybindings("emacs")
+
 
 class TestFindConflicts:
     """Tests for find_conflicts."""
@@ -172,6 +180,19 @@ class TestFindConflicts:
         conflicts = find_conflicts(bindings)
         assert len(conflicts) == 2
 
+    def test_three_way_conflict_reports_first_action(self) -> None:
+        """Every later duplicate should be paired with the first action."""
+        bindings = {
+            "action.a": "q",
+            "action.b": "q",
+            "action.c": "q",
+        }
+        conflicts = find_conflicts(bindings)
+        assert [(c.action1, c.action2) for c in conflicts] == [
+            ("action.a", "action.b"),
+            ("action.a", "action.c"),
+        ]
+
 
 class TestNormalizeKey:
     """Tests for normalize_key."""
@@ -191,6 +212,13 @@ class TestNormalizeKey:
         assert normalize_key("q") == "q"
         assert normalize_key("ctrl+s") == "ctrl+s"
 
+    def test_results_are_cached(self) -> None:
+        """Repeated calls with the same key should hit the cache."""
+        normalize_key("Ctrl+Shift+X")
+        hits = normalize_key.cache_info().hits
+        assert normalize_key("Ctrl+Shift+X") == "ctrl+shift+x"
+        assert normalize_key.cache_info().hits == hits + 1
+
 
 class TestFormatKeyForDisplay:
     """Tests for format_key_for_display."""
@@ -220,6 +248,13 @@ class TestFormatKeyForDisplay:
         assert format_key_for_display("f2") == "F2"
         assert format_key_for_display("f12") == "F12"
 
+    def test_results_are_cached(self) -> None:
+        """Repeated calls with the same key should hit the cache."""
+        format_key_for_display("alt+shift+period")
+        hits = format_key_for_display.cache_info().hits
+        assert format_key_for_display("alt+shift+period") == "Alt+PERIOD"
+        assert format_key_for_display.cache_info().hits == hits + 1
+
 
 class TestValidateKey:
     """Tests for validate_key."""
@@ -266,6 +301,11 @@ class TestValidateKey:
         assert validate_key("ctrl") is False
         assert validate_key("ctrl+") is False
 
+    def test_profile_keys_valid(self) -> None:
+        """Every key used by a built-in profile is valid."""
+        for key in list(VIM_KEYBINDINGS.values()) + list(EMACS_KEYBINDINGS.values()):
+            assert validate_key(key) is True, key
+
     def test_invalid_key(self) -> None:
         """Invalid key names are rejected."""
         assert validate_key("invalid") is False
@@ -303,6 +343,23 @@ class TestGetActionCategories:
         for action_id in ACTION_REGISTRY:
             assert action_id in all_categorized
 
+    def test_returns_independent_copy(self) -> None:
+        """Mutating the result should not affect later calls."""
+        categories = get_action_categories()
+        categories["Navigation"].append("bogus")
+        categories["Bogus"] = []
+
+        fresh = get_action_categories()
+        assert "bogus" not in fresh["Navigation"]
+        assert "Bogus" not in fresh
+
+    def test_shared_view_matches_copy(self) -> None:
+        """ACTION_CATEGORIES should hold the same grouping, read-only."""
+        categories = get_action_categories()
+        assert {cat: list(ids) for cat, ids in ACTION_CATEGORIES.items()} == categories
+        with pytest.raises(TypeError):
+            ACTION_CATEGORIES["Bogus"] = ()  # type: ignore[index]
+
 
 class TestValidProfiles:
     """Tests for VALID_PROFILES."""
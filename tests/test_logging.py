@@ -66,6 +66,32 @@ class TestSetupLogging:
 
         assert logger.level == logging.DEBUG
 
+    def test_writes_through_queue_listener(self, tmp_path: Path, monkeypatch) -> None:
+        """Records should be redacted and written by the background listener."""
+        from logging.handlers import QueueHandler
+
+        log_file = tmp_path / "rally-tui.log"
+        monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(UserSettings, "CONFIG_FILE", tmp_path / "config.json")
+        monkeypatch.setattr(UserSettings, "LOG_FILE", log_file)
+
+        # Reset initialization flag
+        import rally_tui.utils.logging as logging_module
+
+        logging_module._initialized = False
+
+        settings = UserSettings()
+        logger = setup_logging(settings)
+        assert [type(h) for h in logger.handlers] == [QueueHandler]
+
+        logger.info("Connecting with apikey=%s", "_secret123")
+        # Stopping the listener flushes the queue
+        logging_module._stop_listener()
+
+        content = log_file.read_text()
+        assert "apikey=[REDACTED]" in content
+        assert "_secret123" not in content
+
 
 class TestGetLogger:
     """Tests for get_logger function."""
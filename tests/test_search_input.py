@@ -61,9 +61,57 @@ class TestSearchInputWidget:
             search = app.query_one(SearchInput)
             search.focus()
             await pilot.press("t", "e", "s", "t")
-            assert len(messages) == 4
+            await pilot.pause(SearchInput.DEBOUNCE_DELAY * 3)
             assert messages[-1].query == "test"
 
+    async def test_typing_burst_emits_single_search_changed(self, monkeypatch) -> None:
+        """A burst of keystrokes should be coalesced into one SearchChanged."""
+        from textual.app import App, ComposeResult
+
+        monkeypatch.setattr(SearchInput, "DEBOUNCE_DELAY", 0.3)
+        messages: list[SearchInput.SearchChanged] = []
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield SearchInput(id="search")
+
+            def on_search_input_search_changed(self, event: SearchInput.SearchChanged) -> None:
+                messages.append(event)
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            search = app.query_one(SearchInput)
+            search.focus()
+            await pilot.press("t", "e", "s", "t")
+            assert messages == []
+            await pilot.pause(0.5)
+            assert [m.query for m in messages] == ["test"]
+
+    async def test_submit_flushes_pending_search(self, monkeypatch) -> None:
+        """Enter should emit the pending SearchChanged before SearchSubmitted."""
+        from textual.app import App, ComposeResult
+
+        monkeypatch.setattr(SearchInput, "DEBOUNCE_DELAY", 10.0)
+        events: list[tuple[str, str]] = []
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield SearchInput(id="search")
+
+            def on_search_input_search_changed(self, event: SearchInput.SearchChanged) -> None:
+                events.append(("changed", event.query))
+
+            def on_search_input_search_submitted(self, event: SearchInput.SearchSubmitted) -> None:
+                events.append(("submitted", event.query))
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            search = app.query_one(SearchInput)
+            search.focus()
+            await pilot.press("a", "b")
+            await pilot.press("enter")
+            assert events == [("changed", "ab"), ("submitted", "ab")]
+
     async def test_enter_emits_search_submitted(self) -> None:
         """Enter key should emit SearchSubmitted."""
         from textual.app import App, ComposeResult
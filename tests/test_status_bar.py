@@ -61,6 +61,14 @@ class TestStatusBarUnit:
         bar.set_connected(True)
         assert bar.connected is True
 
+    def test_connected_status_follows_connection(self) -> None:
+        """The cached status text should update when the connection changes."""
+        bar = StatusBar(current_user="Jane Doe")
+        bar.set_connected(True)
+        assert bar.display_content == "Connected as Jane Doe"
+        bar.set_connected(False)
+        assert bar.display_content == "Offline"
+
     def test_default_filter_info_is_empty(self) -> None:
         """Default filter_info should be empty string."""
         bar = StatusBar()
@@ -115,6 +123,90 @@ class TestStatusBarUnit:
         bar.set_user_filter(False)
         assert bar.user_filter_active is False
 
+    def test_unchanged_state_skips_update(self) -> None:
+        """Re-applying the current state should not re-render the bar."""
+        bar = StatusBar()
+        bar.set_loading(True)
+        calls: list[object] = []
+        bar.update = calls.append  # type: ignore[method-assign]
+        bar.set_loading(True)
+        bar.set_selection_count(0)
+        assert calls == []
+        bar.set_loading(False)
+        assert len(calls) == 1
+
+    def test_batch_update_renders_once(self) -> None:
+        """Setters inside batch_update() should render once on exit."""
+        bar = StatusBar()
+        calls: list[object] = []
+        bar.update = calls.append  # type: ignore[method-assign]
+        with bar.batch_update():
+            bar.set_project("Proj")
+            bar.set_iteration_filter("Sprint 1")
+            with bar.batch_update():
+                bar.set_user_filter(True)
+            assert calls == []
+        assert len(calls) == 1
+        assert "Sprint: Sprint 1" in bar.display_content
+        assert "My Items" in bar.display_content
+
+    async def test_batch_update_when_mounted_renders_on_exit(self) -> None:
+        """A mounted bar should render once when batch_update() exits, not via timer."""
+        from textual.app import App, ComposeResult
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield StatusBar(id="status-bar")
+
+        app = TestApp()
+        async with app.run_test():
+            bar = app.query_one(StatusBar)
+            calls: list[object] = []
+            bar.update = calls.append  # type: ignore[method-assign]
+            with bar.batch_update():
+                bar.set_project("Proj")
+                bar.set_user_filter(True)
+                assert bar._pending_update is None
+            assert len(calls) == 1
+            assert bar._pending_update is None
+            assert "Project: Proj" in bar._display_content
+
+
+class TestStatusBarSortMode:
+    """Tests for the sort mode segment."""
+
+    def test_set_sort_mode_shows_name(self) -> None:
+        """set_sort_mode should record the name and render the segment."""
+        from rally_tui.widgets.ticket_list import SortMode
+
+        bar = StatusBar()
+        bar.set_sort_mode(SortMode.OWNER)
+        assert bar.sort_mode_display == "Owner"
+        assert "Sort: Owner" in bar.display_content
+
+
+class TestStatusBarLayout:
+    """Tests for segment order in the rendered bar."""
+
+    def test_all_segments_in_order(self) -> None:
+        """Every segment should render in its fixed position."""
+        from rally_tui.widgets.status_bar import CacheStatusDisplay
+        from rally_tui.widgets.ticket_list import SortMode
+
+        bar = StatusBar(project="Proj", connected=True, current_user="Jane")
+        bar.set_loading(True)
+        bar.set_selection_count(2)
+        bar.set_iteration_filter("Sprint 1")
+        bar.set_user_filter(True)
+        bar.set_sort_mode(SortMode.STATE)
+        bar.set_filter_info(3, 10)
+        bar.set_cache_status(CacheStatusDisplay.LIVE)
+        assert bar.display_content == (
+            "Project: Proj | [bold cyan]Loading...[/] | [bold cyan]2 selected[/] | "
+            "Sprint: Sprint 1 [cyan]My Items[/] | Sort: State | Filtered: 3/10 | "
+            "[green]● Live[/] | Connected as Jane"
+        )
+
 
 class TestStatusBarWidget:
     """Integration tests for StatusBar widget behavior."""
@@ -351,6 +443,32 @@ class TestStatusBarWidget:
             assert "Sprint: Sprint 26" in content
             assert "My Items" in content
 
+    async def test_rapid_setters_render_once(self) -> None:
+        """Setters called in quick succession should produce one render."""
+        from textual.app import App, ComposeResult
+
+        class TestApp(App[None]):
+            def compose(self) -> ComposeResult:
+                yield StatusBar(id="status-bar")
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            status_bar = app.query_one(StatusBar)
+            calls: list[object] = []
+            original_update = status_bar.update
+
+            def counting_update(content: str) -> None:
+                calls.append(content)
+                original_update(content)
+
+            status_bar.update = counting_update  # type: ignore[method-assign]
+            status_bar.set_loading(True)
+            status_bar.set_selection_count(3)
+            status_bar.set_filter_info(1, 5)
+            await pilot.pause(status_bar.UPDATE_DELAY * 5)
+            assert len(calls) == 1
+            assert "3 selected" in status_bar.display_content
+
 
 class TestStatusBarInApp:
     """Tests for StatusBar integration in the RallyTUI app."""
@@ -416,6 +534,20 @@ class TestStatusBarCacheStatus:
         bar.set_cache_status(CacheStatusDisplay.OFFLINE)
         assert bar.cache_status == CacheStatusDisplay.OFFLINE
 
+    def test_repeated_cache_status_is_not_reformatted(self) -> None:
+        """Re-reporting the same status and age should not re-render it."""
+        from unittest.mock import patch
+
+        from rally_tui.widgets.status_bar import CacheStatusDisplay
+
+        bar = StatusBar()
+        bar.set_cache_status(CacheStatusDisplay.CACHED, 5)
+        with patch.object(bar, "_format_cache_status", return_value="") as fmt:
+            bar.set_cache_status(CacheStatusDisplay.CACHED, 5)
+            fmt.assert_not_called()
+            bar.set_cache_status(CacheStatusDisplay.CACHED, 6)
+            fmt.assert_called_once()
+
     def test_clear_cache_status(self) -> None:
         """clear_cache_status should clear the status."""
         from rally_tui.widgets.status_bar import CacheStatusDisplay
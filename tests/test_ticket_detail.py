@@ -327,3 +327,70 @@ class TestTicketDetailMarkupEscape:
             content = app.query_one("#detail-description")
             rendered = str(content.render())
             assert "arch=" in rendered or "dpkg" in rendered
+
+
+class TestTicketDetailUpdates:
+    """Tests for skipping redundant child updates."""
+
+    def test_accepts_container_arguments(self) -> None:
+        """TicketDetail should accept the same arguments as VerticalScroll."""
+        detail = TicketDetail(name="detail", id="detail-panel", classes="wide", disabled=True)
+        assert detail.name == "detail"
+        assert detail.id == "detail-panel"
+        assert detail.has_class("wide")
+        assert detail.disabled is True
+
+    async def test_unchanged_text_skips_static_update(self) -> None:
+        """Re-showing a ticket with identical text should not touch the Statics."""
+        from textual.widgets import Static
+
+        app = RallyTUI(show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            detail = app.query_one(TicketDetail)
+            ticket = detail.ticket
+            assert ticket is not None
+
+            header = app.query_one("#detail-header", Static)
+            calls: list[object] = []
+            header.update = calls.append  # type: ignore[method-assign]
+            detail._show_ticket(ticket)
+            assert calls == []
+
+    async def test_child_statics_are_queried_once(self) -> None:
+        """Repeated updates should reuse the child Static handles."""
+        from unittest.mock import patch
+
+        from rally_tui.models import Ticket
+
+        app = RallyTUI(show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            detail = app.query_one(TicketDetail)
+            ticket = Ticket(
+                formatted_id="US9999",
+                name="Another ticket",
+                description="Other text",
+                state="Completed",
+                owner="Someone",
+                ticket_type="HierarchicalRequirement",
+            )
+            with patch.object(detail, "query_one", wraps=detail.query_one) as query:
+                detail._show_ticket(ticket)
+                query.assert_not_called()
+
+    async def test_toggle_reuses_rendered_body(self) -> None:
+        """Toggling back to a view should not convert its HTML again."""
+        from unittest.mock import patch
+
+        app = RallyTUI(show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            detail = app.query_one(TicketDetail)
+            detail.toggle_content_view()
+            await pilot.pause()
+            with patch("rally_tui.widgets.ticket_detail.html_to_text") as convert:
+                detail.toggle_content_view()
+                detail.toggle_content_view()
+                await pilot.pause()
+                convert.assert_not_called()
@@ -4,8 +4,16 @@ import pytest
 
 from rally_tui.app import RallyTUI
 from rally_tui.models import Ticket
-from rally_tui.widgets import SortMode, TicketList
+from rally_tui.widgets import SortMode, TicketList, TicketListItem
 from rally_tui.widgets.ticket_list import (
+    DEFAULT_STATE_COLOR,
+    DEFAULT_STATE_ORDER,
+    DEFAULT_STATE_SYMBOL,
+    STATE_COLORS,
+    STATE_ORDER,
+    STATE_SYMBOLS,
+    _state_markup,
+    get_state_meta,
     sort_tickets,
     sort_tickets_by_created,
     sort_tickets_by_owner,
@@ -180,6 +188,70 @@ class TestTicketListFilter:
             assert ticket_list.filtered_count == 1
             assert ticket_list._tickets[0].formatted_id == "US1001"
 
+    async def test_extended_query_narrows_previous_matches(
+        self, sample_tickets: list[Ticket]
+    ) -> None:
+        """Extending the query should only re-check the current matches."""
+        from unittest.mock import patch
+
+        from rally_tui.services import MockRallyClient
+
+        client = MockRallyClient(tickets=sample_tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test():
+            ticket_list = app.query_one(TicketList)
+            ticket_list.filter_tickets("log")
+            assert ticket_list.filtered_count == 2
+
+            with patch.object(
+                ticket_list, "_matches_query", wraps=ticket_list._matches_query
+            ) as matches:
+                ticket_list.filter_tickets("LOGIN")
+                assert matches.call_count == 2
+            assert ticket_list.filtered_count == 2
+
+            # A query that doesn't extend the previous one scans everything
+            ticket_list.filter_tickets("reset")
+            assert [t.formatted_id for t in ticket_list._tickets] == ["US1002"]
+
+    async def test_narrowed_filter_removes_only_unmatched_items(
+        self, sample_tickets: list[Ticket]
+    ) -> None:
+        """Narrowing the matches should keep the items that still match."""
+        from rally_tui.services import MockRallyClient
+
+        client = MockRallyClient(tickets=sample_tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            ticket_list = app.query_one(TicketList)
+            await pilot.pause()
+            before = {item.ticket.formatted_id: item for item in ticket_list.query(TicketListItem)}
+
+            ticket_list.filter_tickets("login")
+            await pilot.pause()
+
+            items = list(ticket_list.query(TicketListItem))
+            assert [item.ticket.formatted_id for item in items] == [
+                t.formatted_id for t in ticket_list._tickets
+            ]
+            assert len(items) == 2
+            assert all(item is before[item.ticket.formatted_id] for item in items)
+
+    async def test_filter_with_same_result_reuses_items(self, sample_tickets: list[Ticket]) -> None:
+        """A filter that leaves the visible tickets unchanged should keep the widgets."""
+        from rally_tui.services import MockRallyClient
+
+        client = MockRallyClient(tickets=sample_tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            ticket_list = app.query_one(TicketList)
+            ticket_list.filter_tickets("login")
+            await pilot.pause()
+            items = list(ticket_list.query(TicketListItem))
+            ticket_list.filter_tickets("logi")
+            await pilot.pause()
+            assert list(ticket_list.query(TicketListItem)) == items
+
     async def test_filter_by_name(self, sample_tickets: list[Ticket]) -> None:
         """Filter should match ticket name."""
         from rally_tui.services import MockRallyClient
@@ -321,6 +393,34 @@ class TestTicketListFilter:
             assert ticket_list.filtered_count == 0  # "None" shouldn't match None value
 
 
+class TestStateMeta:
+    """Tests for the combined state metadata lookup."""
+
+    @pytest.mark.parametrize("state", list(STATE_ORDER))
+    def test_known_state(self, state: str) -> None:
+        """Known states should return their order, color and symbol."""
+        assert get_state_meta(state) == (
+            STATE_ORDER[state],
+            STATE_COLORS[state],
+            STATE_SYMBOLS[state],
+        )
+
+    @pytest.mark.parametrize("state", [None, "", "Unknown"])
+    def test_unknown_state_uses_defaults(self, state: str | None) -> None:
+        """Missing or unknown states should return the defaults."""
+        assert get_state_meta(state) == (
+            DEFAULT_STATE_ORDER,
+            DEFAULT_STATE_COLOR,
+            DEFAULT_STATE_SYMBOL,
+        )
+
+    @pytest.mark.parametrize("state", ["Defined", "Unknown", None])
+    def test_state_markup(self, state: str | None) -> None:
+        """State markup should wrap the state's symbol in its color."""
+        _, color, symbol = get_state_meta(state)
+        assert _state_markup(state) == f"[{color}]{symbol}[/]"
+
+
 class TestTicketListSorting:
     """Tests for ticket list sorting functionality."""
 
@@ -597,6 +697,60 @@ class TestTicketListSelection:
 
             assert ticket_list.selection_count == 3
 
+    async def test_ctrl_a_repaints_only_newly_selected(self) -> None:
+        """Ctrl+A should only update rows that were not already selected."""
+        from unittest.mock import patch
+
+        from rally_tui.services import MockRallyClient
+
+        tickets = [
+            Ticket("US1", "Story 1", "UserStory", "Defined"),
+            Ticket("US2", "Story 2", "UserStory", "Defined"),
+            Ticket("US3", "Story 3", "UserStory", "Defined"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+            await pilot.press("space")
+            await pilot.pause()
+            first = ticket_list._tickets[0].formatted_id
+
+            with patch.object(
+                ticket_list,
+                "_update_item_selection",
+                wraps=ticket_list._update_item_selection,
+            ) as update:
+                ticket_list.action_select_all()
+                updated = {call.args[0] for call in update.call_args_list}
+
+            assert ticket_list.selection_count == 3
+            assert first not in updated
+            assert len(updated) == 2
+
+    async def test_select_all_repaints_in_one_batch(self) -> None:
+        """Select-all and clear should update all rows in a single app batch."""
+        from unittest.mock import patch
+
+        from rally_tui.services import MockRallyClient
+
+        tickets = [
+            Ticket("US1", "Story 1", "UserStory", "Defined"),
+            Ticket("US2", "Story 2", "UserStory", "Defined"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+
+            with patch.object(app, "batch_update", wraps=app.batch_update) as batch:
+                ticket_list.action_select_all()
+                assert batch.call_count == 1
+                ticket_list.clear_selection()
+                assert batch.call_count == 2
+
     async def test_ctrl_a_deselects_if_all_selected(self) -> None:
         """Ctrl+A when all selected should deselect all."""
         from rally_tui.services import MockRallyClient
@@ -731,6 +885,107 @@ class TestTicketListBulkUpdate:
             assert ui_states["US2"] == "Completed"
             assert ui_states["US3"] == "Defined"
 
+    async def test_update_without_resort_updates_matching_item(self) -> None:
+        """update_ticket(resort=False) should update the item for that ticket."""
+        from rally_tui.services import MockRallyClient
+        from rally_tui.widgets.ticket_list import TicketListItem
+
+        tickets = [
+            Ticket("US1", "Story 1", "UserStory", "Defined"),
+            Ticket("US2", "Story 2", "UserStory", "Defined"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+
+            updated = Ticket("US2", "Story 2", "UserStory", "Defined", owner="Jane")
+            ticket_list.update_ticket(updated, resort=False)
+
+            items = {item.ticket.formatted_id: item for item in ticket_list.query(TicketListItem)}
+            assert items["US2"].ticket is updated
+            assert items["US1"].ticket.owner is None
+
+    async def test_add_ticket_after_unsorted_update_resorts(self) -> None:
+        """add_ticket should re-sort when an in-place update moved a sort key."""
+        from rally_tui.services import MockRallyClient
+
+        tickets = [
+            Ticket("US1", "Story 1", "UserStory", "Defined", parent_id="F1"),
+            Ticket("US2", "Story 2", "UserStory", "Defined", parent_id="F2"),
+            Ticket("US3", "Story 3", "UserStory", "Defined", parent_id="F3"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+            ticket_list.set_sort_mode(SortMode.PARENT)
+
+            moved = Ticket("US1", "Story 1", "UserStory", "Defined", parent_id="F9")
+            ticket_list.update_ticket(moved, resort=False)
+            ticket_list.add_ticket(Ticket("US4", "Story 4", "UserStory", "Defined", parent_id="F5"))
+            await pilot.pause()
+
+            expected = ["F2", "F3", "F5", "F9"]
+            assert [t.parent_id for t in ticket_list._all_tickets] == expected
+            assert [t.parent_id for t in ticket_list._tickets] == expected
+            assert ticket_list.selected_ticket is not None
+            assert ticket_list.selected_ticket.formatted_id == "US4"
+
+    async def test_update_keeping_order_reuses_items(self) -> None:
+        """A re-sorting update that leaves the order unchanged should keep the items."""
+        from rally_tui.services import MockRallyClient
+        from rally_tui.widgets.ticket_list import TicketListItem
+
+        tickets = [
+            Ticket("US1", "Story 1", "UserStory", "Defined"),
+            Ticket("US2", "Story 2", "UserStory", "Completed"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+            before = list(ticket_list.query(TicketListItem))
+
+            updated = Ticket("US1", "Story 1 renamed", "UserStory", "In-Progress")
+            ticket_list.update_ticket(updated)
+            await pilot.pause()
+
+            items = list(ticket_list.query(TicketListItem))
+            assert items == before
+            assert items[0].ticket is updated
+            assert "Story 1 renamed" in str(items[0].query(".ticket-text").first().render())
+
+    async def test_add_ticket_inserts_without_rebuilding(self) -> None:
+        """add_ticket should mount only the new item, at its sorted position."""
+        from rally_tui.services import MockRallyClient
+        from rally_tui.widgets.ticket_list import TicketListItem
+
+        tickets = [
+            Ticket("US3", "Story 3", "UserStory", "Defined"),
+            Ticket("US1", "Story 1", "UserStory", "Defined"),
+        ]
+        client = MockRallyClient(tickets=tickets)
+        app = RallyTUI(client=client, show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+            ticket_list.set_sort_mode(SortMode.CREATED)
+            await pilot.pause()
+            before = list(ticket_list.query(TicketListItem))
+
+            ticket_list.add_ticket(Ticket("US2", "Story 2", "UserStory", "Defined"))
+            await pilot.pause()
+
+            items = list(ticket_list.query(TicketListItem))
+            assert [item.ticket.formatted_id for item in items] == ["US3", "US2", "US1"]
+            assert items[0] is before[0] and items[2] is before[1]
+            assert ticket_list.index == 1
+            assert ticket_list.highlighted_child is items[1]
+
     async def test_update_tickets_preserves_selection(self) -> None:
         """update_tickets should preserve selection state."""
         from rally_tui.services import MockRallyClient
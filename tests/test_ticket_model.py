@@ -1,5 +1,7 @@
 """Unit tests for the Ticket model."""
 
+import sys
+
 import pytest
 
 from rally_tui.models import Ticket
@@ -69,6 +71,51 @@ class TestTicket:
         ticket = Ticket("US1", "Test", "UserStory", "Open", parent_id="F59625")
         assert ticket.parent_id == "F59625"
 
+    def test_id_number(self) -> None:
+        """id_number should be the numeric part of formatted_id."""
+        assert Ticket("US1234", "Test", "UserStory", "Open").id_number == 1234
+        assert Ticket("F59625", "Test", "UserStory", "Open").id_number == 59625
+
+    def test_id_number_without_digits(self) -> None:
+        """id_number should be 0 when formatted_id has no digits."""
+        assert Ticket("NEW", "Test", "UserStory", "Open").id_number == 0
+
+    def test_id_number_is_cached_without_affecting_equality(self) -> None:
+        """Caching id_number should not change equality or hashing."""
+        t1 = Ticket("US1", "Test", "UserStory", "Open")
+        t2 = Ticket("US1", "Test", "UserStory", "Open")
+        assert t1.id_number == 1
+        assert t1 == t2
+        assert hash(t1) == hash(t2)
+
+    def test_state_is_interned(self) -> None:
+        """Tickets with equal states should share one state string."""
+        state = "".join(["In-", "Progress"])
+        ticket = Ticket("US1", "Story", "UserStory", state)
+        assert ticket.state is sys.intern("In-Progress")
+
+    def test_owner_sort_key(self) -> None:
+        """Unassigned tickets sort first, then by case-insensitive owner."""
+        assert Ticket("US1", "A", "UserStory", "Open").owner_sort_key == (0, "")
+        ticket = Ticket("US2", "B", "UserStory", "Open", owner="Jane Doe")
+        assert ticket.owner_sort_key == (1, "jane doe")
+
+    def test_parent_sort_key(self) -> None:
+        """Orphan tickets sort first, then by case-insensitive parent ID."""
+        assert Ticket("US1", "A", "UserStory", "Open").parent_sort_key == (0, "")
+        ticket = Ticket("US2", "B", "UserStory", "Open", parent_id="F59625")
+        assert ticket.parent_sort_key == (1, "f59625")
+
+    def test_search_text(self) -> None:
+        """search_text should hold the lowercased searchable fields."""
+        ticket = Ticket("US1", "Login Page", "UserStory", "In-Progress", "Jane Doe")
+        assert ticket.search_text == "us1 login page jane doe in-progress"
+
+    def test_search_text_without_owner(self) -> None:
+        """A missing owner should leave an empty field."""
+        ticket = Ticket("US1", "Login", "UserStory", "Open")
+        assert ticket.search_text == "us1 login  open"
+
 
 class TestTicketRallyUrl:
     """Tests for the rally_url method."""
@@ -293,7 +293,7 @@ class TestUserSettingsParentOptions:
         monkeypatch.setattr(UserSettings, "CONFIG_FILE", tmp_path / "config.json")
 
         settings = UserSettings()
-        assert settings.parent_options == ["F59625", "F59627", "F59628"]
+        assert settings.parent_options == ("F59625", "F59627", "F59628")
 
     def test_set_parent_options(self, tmp_path: Path, monkeypatch) -> None:
         """Should be able to set custom parent options."""
@@ -302,7 +302,7 @@ class TestUserSettingsParentOptions:
 
         settings = UserSettings()
         settings.parent_options = ["F111", "F222", "F333"]
-        assert settings.parent_options == ["F111", "F222", "F333"]
+        assert settings.parent_options == ("F111", "F222", "F333")
 
     def test_parent_options_persists_to_file(self, tmp_path: Path, monkeypatch) -> None:
         """parent_options should persist to config file."""
@@ -329,7 +329,7 @@ class TestUserSettingsParentOptions:
             json.dump({"parent_options": ["F777", "F888"]}, f)
 
         settings = UserSettings()
-        assert settings.parent_options == ["F777", "F888"]
+        assert settings.parent_options == ("F777", "F888")
 
     def test_invalid_parent_options_raises(self, tmp_path: Path, monkeypatch) -> None:
         """Invalid parent_options should raise ValueError."""
@@ -349,8 +349,8 @@ class TestUserSettingsParentOptions:
         with pytest.raises(ValueError, match="Parent options must be a list of strings"):
             settings.parent_options = [1, 2, 3]  # type: ignore[list-item]
 
-    def test_parent_options_returns_copy(self, tmp_path: Path, monkeypatch) -> None:
-        """parent_options should return a copy to prevent mutation."""
+    def test_parent_options_is_immutable(self, tmp_path: Path, monkeypatch) -> None:
+        """parent_options should return an immutable tuple."""
         monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
         monkeypatch.setattr(UserSettings, "CONFIG_FILE", tmp_path / "config.json")
 
@@ -359,10 +359,18 @@ class TestUserSettingsParentOptions:
         settings.parent_options = ["F111", "F222"]
 
         options = settings.parent_options
-        options.append("F999")
+        assert isinstance(options, tuple)
+        # Repeated reads reuse the same tuple
+        assert settings.parent_options is options
 
-        # Original should not be modified
-        assert settings.parent_options == ["F111", "F222"]
+    def test_set_parent_options_accepts_tuple(self, tmp_path: Path, monkeypatch) -> None:
+        """Setter should accept a tuple as well as a list."""
+        monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(UserSettings, "CONFIG_FILE", tmp_path / "config.json")
+
+        settings = UserSettings()
+        settings.parent_options = ("F111",)
+        assert settings.parent_options == ("F111",)
 
 
 class TestUserSettingsKeybindingProfile:
@@ -487,6 +495,35 @@ class TestUserSettingsKeybindings:
         # Original should not be modified
         assert settings.keybindings["navigation.down"] == "j"
 
+    def test_keybindings_mutation_does_not_touch_profile_defaults(
+        self, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Writing to the merged view should never modify the profile defaults."""
+        from rally_tui.utils.keybindings import VIM_KEYBINDINGS
+
+        monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(UserSettings, "CONFIG_FILE", tmp_path / "config.json")
+
+        settings = UserSettings()
+        bindings = settings.keybindings
+        bindings["navigation.up"] = "changed"
+
+        assert VIM_KEYBINDINGS["navigation.up"] == "k"
+
+    def test_keybindings_ignore_unknown_overrides(self, tmp_path: Path, monkeypatch) -> None:
+        """Overrides for unknown actions or non-string keys should be dropped."""
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
+        monkeypatch.setattr(UserSettings, "CONFIG_FILE", config_file)
+
+        with config_file.open("w") as f:
+            json.dump({"keybindings": {"bogus.action": "x", "navigation.down": 5}}, f)
+
+        settings = UserSettings()
+        bindings = settings.keybindings
+        assert "bogus.action" not in bindings
+        assert bindings["navigation.down"] == "j"
+
     def test_set_keybindings_switches_to_custom(self, tmp_path: Path, monkeypatch) -> None:
         """Setting keybindings should switch to custom profile."""
         monkeypatch.setattr(UserSettings, "CONFIG_DIR", tmp_path)
@@ -5,6 +5,7 @@ from rally_tui.models import Ticket
 from rally_tui.widgets import TicketList, ViewMode
 from rally_tui.widgets.ticket_list import (
     WideTicketListItem,
+    _format_points,
 )
 
 
@@ -248,6 +249,23 @@ class TestWideViewIntegration:
             # Selection should be preserved
             assert ticket_list._selected_ids == selected_ids_before
 
+    async def test_wide_view_selection_updates_checkbox(self) -> None:
+        """Toggling selection in wide view should update the wide item."""
+        app = RallyTUI(show_splash=False)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            ticket_list = app.query_one(TicketList)
+            await pilot.press("v")
+            await pilot.pause()
+
+            await pilot.press("space")
+            await pilot.pause()
+
+            selected = [item for item in ticket_list.query(WideTicketListItem) if item.is_selected]
+            assert [item.ticket.formatted_id for item in selected] == list(
+                ticket_list._selected_ids
+            )
+
     async def test_wide_view_restores_detail_pane(self) -> None:
         """Toggling back to normal view should restore detail pane visibility."""
         from rally_tui.widgets import TicketDetail
@@ -505,6 +523,12 @@ class TestWideViewItemDisplay:
         assert ticket.points == 2.5
         assert ticket.points != int(ticket.points)
 
+    def test_format_points(self) -> None:
+        """Points format as whole numbers, decimals, or '-' when unset."""
+        assert _format_points(5.0) == "5"
+        assert _format_points(2.5) == "2.5"
+        assert _format_points(None) == "-"
+
     def test_missing_owner_displayed_as_dash(self) -> None:
         """Missing owner should show as '-'."""
         ticket = Ticket(